@@ -231,6 +231,8 @@ class CycleTracker:
         the current `CycleTracker.cycle_ready`). Derived classes can override this method to add their own logic to compute this value.
     """
 
+    __slots__ = ('__cycle_ready', 'tag')
+
     def __init__(self, cycle_ready: CycleType):
         """
         Initializes a new CycleTracker object.
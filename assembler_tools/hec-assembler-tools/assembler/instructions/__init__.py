@@ -18,11 +18,8 @@ def tokenizeFromLine(line: str) -> list:
         comment = ""
         if line:
             line = ''.join(line.splitlines()) # remove line breaks
-            comment_idx = line.find('#')
-            if comment_idx >= 0:
-                # Found a comment
-                comment = line[comment_idx + 1:]
-                line = line[:comment_idx]
-            tokens = tuple(map(lambda s: s.strip(), line.split(',')))
+            # Split off comment (if any)
+            line, _, comment = line.partition('#')
+            tokens = tuple(map(str.strip, line.split(',')))
         retval = (tokens, comment)
         return retval
@@ -54,9 +54,9 @@ class Instruction(CInstruction):
         """
         if not mem_model:
             raise ValueError('`mem_model` cannot be `None`.')
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
         super().__init__(id, throughput, latency, comment=comment)
         self.col_num = col_num
@@ -34,9 +34,9 @@ class Instruction(CInstruction):
             latency (int, optional): The latency of the instruction. Defaults to the class-defined latency.
             comment (str, optional): An optional comment for the instruction.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
         super().__init__(id, throughput, latency, comment=comment)
 
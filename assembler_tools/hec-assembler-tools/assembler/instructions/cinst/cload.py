@@ -51,9 +51,9 @@ class Instruction(CInstruction):
             AssertionError: If the destination register bank index is not 0.
         """
         assert(dst.bank.bank_index == 0) # We must be following convention of loading from SPAD into bank 0
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
         super().__init__(id, throughput, latency, comment=comment)
         self.__mem_model = mem_model
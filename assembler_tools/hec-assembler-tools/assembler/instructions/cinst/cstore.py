@@ -54,9 +54,9 @@ class Instruction(CInstruction):
         """
         if not isinstance(mem_model, MemoryModel):
             raise ValueError('`mem_model` must be an instance of `MemoryModel`.')
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
         super().__init__(id, throughput, latency, comment=comment)
         self.__mem_model = mem_model
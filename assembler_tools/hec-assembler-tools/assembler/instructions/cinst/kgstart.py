@@ -43,9 +43,9 @@ class Instruction(CInstruction):
 
             comment (str, optional): A comment for the instruction. Defaults to an empty string.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
         super().__init__(id, throughput, latency, comment=comment)
 
@@ -1,14 +1,18 @@
-﻿from typing import final
-from typing import NamedTuple
+﻿from dataclasses import dataclass
+from typing import final
 
 from assembler.common.config import GlobalConfig
 from assembler.common.counter import Counter
 from assembler.common.cycle_tracking import CycleTracker, CycleType
 from assembler.common.decorators import *
+from assembler.memory_model.variable import Variable
 
-class ScheduleTiming(NamedTuple):
+@dataclass(slots=True)
+class ScheduleTiming:
     """
-    A named tuple to add structure to schedule timing.
+    A mutable record to add structure to schedule timing.
+
+    The index is updated in place during the second pass of scheduling.
 
     Attributes:
         cycle (CycleType): The cycle in which the instruction was scheduled.
@@ -37,6 +41,10 @@ class BaseInstruction(CycleTracker):
         _get_OP_NAME_PISA(cls) -> str: Derived classes should implement this method and return the correct
             P-ISA name for the operation. Defaults to the ASM-ISA name.
 
+    Static Methods:
+        _validateVarList(value, num_vars: int): Validates a list of `Variable` objects to set as sources
+            or destinations. Derived classes can call it from _set_dests and _set_sources.
+
     Constructors:
         __init__(self, id: int, throughput: int, latency: int, comment: str = ""): 
             Initializes a new BaseInstruction object.
@@ -44,10 +52,10 @@ class BaseInstruction(CycleTracker):
     Attributes:
         _dests (list[CycleTracker]): List of destination objects. Derived classes can override 
             _set_dests to validate this attribute.
-        _frozen_cisa (str): Contains frozen CInst in ASM ISA format after scheduling. Empty string if not frozen.
-        _frozen_misa (str): Contains frozen MInst in ASM ISA format after scheduling. Empty string if not frozen.
-        _frozen_pisa (str): Contains frozen P-ISA format after scheduling. Empty string if not frozen.
-        _frozen_xisa (str): Contains frozen XInst in ASM ISA format after scheduling. Empty string if not frozen.
+        _frozen (dict): Maps format keys ('pisa', 'xisa', 'cisa', 'misa') to the frozen string representation
+            of the instruction in that format after scheduling. Only non-empty formats are stored.
+            None if not frozen.
+        _is_scheduled (bool): Whether the instruction has been scheduled. Backs property `is_scheduled`.
         _sources (list[CycleTracker]): List of source objects. Derived classes can override 
             _set_sources to validate this attribute.
         comment (str): Comment for the instruction.
@@ -97,6 +105,9 @@ class BaseInstruction(CycleTracker):
         toCASMISAFormat(self) -> str: Converts the instruction to CInst ASM-ISA format.
         toMASMISAFormat(self) -> str: Converts the instruction to MInst ASM-ISA format.
     """
+    __slots__ = ('__id', '__throughput', '__latency', '__schedule_timing',
+                 '_dests', '_sources', '_frozen', '_is_scheduled', 'comment')
+
     # To be initialized from ASM ISA spec
     _OP_NUM_DESTS          : int
     _OP_NUM_SOURCES        : int
@@ -181,6 +192,27 @@ class BaseInstruction(CycleTracker):
         """
         raise NotImplementedError('Abstract method not implemented.')
 
+    @staticmethod
+    def _validateVarList(value, num_vars: int):
+        """
+        Validates a list of `Variable` objects to set as sources or destinations.
+
+        Parameters:
+            value (list): The list of `Variable` objects to validate.
+
+            num_vars (int): Expected number of `Variable` objects in the list.
+
+        Raises:
+            ValueError: If the number of elements is incorrect or the list does not contain `Variable` objects.
+        """
+        if len(value) != num_vars:
+            raise ValueError(("`value`: Expected list of {} `Variable` objects, "
+                              "but list with {} elements received.".format(num_vars,
+                                                                           len(value))))
+        for x in value:
+            if not isinstance(x, Variable):
+                raise ValueError("`value`: Expected list of `Variable` objects.")
+
     # Constructor
     # -----------
 
@@ -225,11 +257,9 @@ class BaseInstruction(CycleTracker):
                                             "; " if comment.strip() else "",
                                             comment)
         self.__schedule_timing: ScheduleTiming = None # Tracks when was this instruction scheduled, or None if not scheduled yet
+        self._is_scheduled = False # Set once `_schedule()` has recorded the schedule timing
 
-        self._frozen_pisa = "" # To contain frozen P-ISA format after scheduling
-        self._frozen_xisa = "" # To contain frozen XInst in ASM ISA format after scheduling
-        self._frozen_cisa = "" # To contain frozen CInst in ASM ISA format after scheduling
-        self._frozen_misa = "" # To contain frozen MInst in ASM ISA format after scheduling
+        self._frozen: dict = None # To contain frozen formats after scheduling, keyed by format
 
     def __repr__(self):
         """
@@ -300,8 +330,7 @@ class BaseInstruction(CycleTracker):
         """
         if value < 0:
             raise ValueError("`value`: expected a value of `0` or greater for `schedule_timing.index`.")
-        self.__schedule_timing = ScheduleTiming(cycle = self.__schedule_timing.cycle,
-                                                index=value)
+        self.__schedule_timing.index = value
 
     @property
     def is_scheduled(self) -> bool:
@@ -311,7 +340,7 @@ class BaseInstruction(CycleTracker):
         Returns:
             bool: True if the instruction is scheduled, False otherwise.
         """
-        return True if self.schedule_timing else False
+        return self._is_scheduled
 
     @property
     def throughput(self) -> int:
@@ -363,9 +392,10 @@ class BaseInstruction(CycleTracker):
         Raises:
             ValueError: If the value is not a list of CycleTracker objects.
         """
-        if not all(isinstance(x, CycleTracker) for x in value):
-            raise ValueError("`value`: Expected list of `CycleTracker` objects.")
-        self._dests = [ x for x in value ]
+        for x in value:
+            if not isinstance(x, CycleTracker):
+                raise ValueError("`value`: Expected list of `CycleTracker` objects.")
+        self._dests = list(value)
 
     @property
     def sources(self) -> list:
@@ -397,9 +427,10 @@ class BaseInstruction(CycleTracker):
         Raises:
             ValueError: If the value is not a list of CycleTracker objects.
         """
-        if not all(isinstance(x, CycleTracker) for x in value):
-            raise ValueError("`value`: Expected list of `CycleTracker` objects.")
-        self._sources = [ x for x in value ]
+        for x in value:
+            if not isinstance(x, CycleTracker):
+                raise ValueError("`value`: Expected list of `CycleTracker` objects.")
+        self._sources = list(value)
 
     def _get_cycle_ready(self):
         """
@@ -417,11 +448,16 @@ class BaseInstruction(CycleTracker):
             CycleType: The current value for ready cycle.
         """
 
-        # we have to be careful that `max` won't iterate on our CycleType tuples' inner values
+        # Single pass over sources and dests comparing whole CycleType tuples:
+        # instruction fan-in is small, so a plain loop beats building
+        # intermediate argument tuples for `max`.
         retval = super()._get_cycle_ready()
-        if self.sources:
-            retval = max(retval, *(src.cycle_ready for src in self.sources))
-        if self.dests:
+        for src in self._sources:
+            src_ready = src.cycle_ready
+            if src_ready > retval:
+                retval = src_ready
+        dests = self._dests
+        if dests:
             # dests cycle ready is a special case:
             # dests are ready to be read or writen to at their cycle_ready, but instructions can
             # start the following cycle when their dests are ready minus the latency of
@@ -438,7 +474,11 @@ class BaseInstruction(CycleTracker):
             # INST1's dests are ready in cycle 6 and they are writen to in cycle 5.
             # If INST2 uses any INST1 dest as its dest, INST2 can start the cycle
             # following INST1, 2, because INST2 will write to the same dest in cycle 6.
-            retval = max(retval, *(dst.cycle_ready - self.latency + 1 for dst in self.dests))
+            latency_offset = self.__latency - 1
+            for dst in dests:
+                dst_ready = dst.cycle_ready - latency_offset
+                if dst_ready > retval:
+                    retval = dst_ready
         return retval
 
     def freeze(self):
@@ -465,10 +505,19 @@ class BaseInstruction(CycleTracker):
         if not self.is_scheduled:
             raise RuntimeError(f"Instruction `{self.name}` (id = {self.id}) is not yet scheduled.")
 
-        self._frozen_pisa = self._toPISAFormat()
-        self._frozen_xisa = self._toXASMISAFormat()
-        self._frozen_cisa = self._toCASMISAFormat()
-        self._frozen_misa = self._toMASMISAFormat()
+        to_pisa = self._toPISAFormat
+        to_xisa = self._toXASMISAFormat
+        to_cisa = self._toCASMISAFormat
+        to_misa = self._toMASMISAFormat
+        frozen = {}
+        for key, to_format in (('pisa', to_pisa),
+                               ('xisa', to_xisa),
+                               ('cisa', to_cisa),
+                               ('misa', to_misa)):
+            s_format = to_format()
+            if s_format:
+                frozen[key] = s_format
+        self._frozen = frozen
 
     def _schedule(self, cycle_count: CycleType, schedule_idx: int) -> int:
         """
@@ -505,6 +554,7 @@ class BaseInstruction(CycleTracker):
                                                                                       self.cycle_ready,
                                                                                       cycle_count))
         self.__schedule_timing = ScheduleTiming(cycle_count, schedule_idx)
+        self._is_scheduled = True
         return self.throughput
 
     @final
@@ -553,14 +603,16 @@ class BaseInstruction(CycleTracker):
         # op, dst0 (bank), dst1 (bank), ..., dst_d (bank), src0 (bank), src1 (bank), ..., src_s (bank) [, extra], res # comment
         if not op_name:
             raise ValueError("`op_name` cannot be empty.")
+        suppress_comments = GlobalConfig.suppressComments
+        comment = self.comment
         retval = op_name
         if preamble:
-            retval = ('{}, '.format(', '.join(str(x) for x in preamble))) + retval
+            retval = ('{}, '.format(', '.join(map(str, preamble)))) + retval
         if extra_args:
-            retval += ', {}'.format(', '.join([str(extra) for extra in extra_args]))
-        if not GlobalConfig.suppressComments:
-            if self.comment:
-                retval += ' #{}'.format(self.comment)
+            retval += ', {}'.format(', '.join(map(str, extra_args)))
+        if not suppress_comments:
+            if comment:
+                retval += ' #{}'.format(comment)
         return retval
 
     @final
@@ -573,7 +625,8 @@ class BaseInstruction(CycleTracker):
             `N, op, dst0 (bank), dst1 (bank), ..., dst_d (bank), src0 (bank), src1 (bank), ..., src_s (bank) [, extra0, extra1, ..., extra_e] [, res] [# comment]`
             where `extra_e` are instruction specific extra arguments.
         """
-        return self._frozen_pisa if self._frozen_pisa else self._toPISAFormat()
+        frozen = self._frozen.get('pisa') if self._frozen else None
+        return frozen if frozen else self._toPISAFormat()
 
     @final
     def toXASMISAFormat(self) -> str:
@@ -594,7 +647,8 @@ class BaseInstruction(CycleTracker):
             Since the residual is mandatory in the format, it is set to `0` in the output if the
             instruction does not support residual.
         """
-        return self._frozen_xisa if self._frozen_xisa else self._toXASMISAFormat()
+        frozen = self._frozen.get('xisa') if self._frozen else None
+        return frozen if frozen else self._toXASMISAFormat()
 
     @final
     def toCASMISAFormat(self) -> str:
@@ -615,7 +669,8 @@ class BaseInstruction(CycleTracker):
             Since the ring size is mandatory in the format, it is set to `0` in the output if the
             instruction does not support it.
         """
-        return self._frozen_cisa if self._frozen_cisa else self._toCASMISAFormat()
+        frozen = self._frozen.get('cisa') if self._frozen else None
+        return frozen if frozen else self._toCASMISAFormat()
 
     @final
     def toMASMISAFormat(self) -> str:
@@ -634,7 +689,8 @@ class BaseInstruction(CycleTracker):
             `op, dst0, dst1, ..., dst_d, src0, src1, ..., src_s [, extra0, extra1, ..., extra_e], [# comment]`
             where `extra_e` are instruction specific extra arguments.
         """
-        return self._frozen_misa if self._frozen_misa else self._toMASMISAFormat()
+        frozen = self._frozen.get('misa') if self._frozen else None
+        return frozen if frozen else self._toMASMISAFormat()
 
     def _toPISAFormat(self, *extra_args) -> str:
         """
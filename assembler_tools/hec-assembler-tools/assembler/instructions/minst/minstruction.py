@@ -1,4 +1,5 @@
-﻿from assembler.common.cycle_tracking import CycleType
+﻿from assembler.common.counter import Counter
+from assembler.common.cycle_tracking import CycleType
 from ..instruction import BaseInstruction
 
 class MInstruction(BaseInstruction):
@@ -13,7 +14,9 @@ class MInstruction(BaseInstruction):
         count: Returns the MInstruction counter value for this instruction.
     """
 
-    __minst_count = 0 # Internal Minst counter
+    __slots__ = ('__count',)
+
+    __minst_count = Counter.count(0) # Internal Minst counter
 
     def __init__(self,
                  id: int,
@@ -33,7 +36,7 @@ class MInstruction(BaseInstruction):
             comment (str, optional): A comment for the instruction. Defaults to an empty string.
         """
         super().__init__(id, throughput, latency, comment=comment)
-        self.__count = MInstruction.__minst_count
+        self.__count = next(MInstruction.__minst_count)
 
     @property
     def count(self):
@@ -68,10 +71,11 @@ class MInstruction(BaseInstruction):
         Returns:
             str: The instruction in MInst ASM-ISA format.
         """
-        # Instruction sources
-        extra_args = tuple(src.toMASMISAFormat() for src in self.sources) + extra_args
         # Instruction destinations
-        extra_args = tuple(dst.toMASMISAFormat() for dst in self.dests) + extra_args
+        args = [dst.toMASMISAFormat() for dst in self.dests]
+        # Instruction sources
+        args.extend([src.toMASMISAFormat() for src in self.sources])
+        args.extend(extra_args)
         return self.toStringFormat(None,
                                    self.OP_NAME_ASM,
-                                   *extra_args)
\ No newline at end of file
+                                   *args)
\ No newline at end of file
@@ -21,6 +21,8 @@ class Instruction(MInstruction):
         dst_spad_addr (int): SPAD address where to load the source variable.
     """
 
+    __slots__ = ('__mem_model', 'dst_spad_addr')
+
     @classmethod
     def _get_OP_NAME_ASM(cls) -> str:
         """
@@ -58,16 +60,15 @@ class Instruction(MInstruction):
 
             comment (str, optional): A comment for the instruction. Defaults to an empty string.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
 
         if not GlobalConfig.useHBMPlaceHolders:
-            for variable in src:
-                if comment:
-                    comment += "; "
-                comment += f'variable "{variable.name}"'
+            comment_parts = [comment] if comment else []
+            comment_parts.extend([f'variable "{variable.name}"' for variable in src])
+            comment = "; ".join(comment_parts)
 
         super().__init__(id, throughput, latency, comment=comment)
         self.__mem_model = mem_model
@@ -79,10 +80,15 @@ class Instruction(MInstruction):
         """
         Returns a string representation of the Instruction object.
 
+        The form is selected by `GlobalConfig.debugVerbose`.
+
         Returns:
-            str: A string representation of the Instruction object, including 
+            str: A string representation of the Instruction object. If `GlobalConfig.debugVerbose` is not set,
+                 this is a short form with only its type, name, and ID. Otherwise, it is a verbose form including
                  its type, name, memory address, ID, source, destination SPAD address, throughput, and latency.
         """
+        if not GlobalConfig.debugVerbose:
+            return f'<{type(self).__name__}({self.name})>(id={self.id})'
         assert(len(self.dests) > 0)
         retval=('<{}({}) object at {}>(id={}[0], '
                   'src={}, dst_spad_addr={}, mem_model, '
@@ -119,12 +125,7 @@ class Instruction(MInstruction):
             ValueError: If the number of destinations is incorrect.
             TypeError: If the list does not contain `Variable` objects.
         """
-        if len(value) != Instruction._OP_NUM_DESTS:
-            raise ValueError(("`value`: Expected list of {} `Variable` objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of `Variable` objects.")
+        self._validateVarList(value, Instruction._OP_NUM_DESTS)
         super()._set_dests(value)
 
     def _set_sources(self, value):
@@ -138,12 +139,7 @@ class Instruction(MInstruction):
             ValueError: If the number of sources is incorrect.
             TypeError: If the list does not contain `Variable` objects.
         """
-        if len(value) != Instruction._OP_NUM_SOURCES:
-            raise ValueError(("`value`: Expected list of {} `Variable` objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of `Variable` objects.")
+        self._validateVarList(value, Instruction._OP_NUM_SOURCES)
         super()._set_sources(value)
 
     def _schedule(self, cycle_count: CycleType, schedule_id: int) -> int:
@@ -169,7 +165,9 @@ class Instruction(MInstruction):
         """
         assert(Instruction._OP_NUM_SOURCES > 0 and len(self.sources) == Instruction._OP_NUM_SOURCES)
         assert(Instruction._OP_NUM_DESTS > 0 and len(self.dests) == Instruction._OP_NUM_DESTS)
-        assert(all(src == dst for src, dst in zip(self.sources, self.dests)))
+        # The constructor sets sources and dests to the same variable, and neither list
+        # is replaced afterwards, so an identity check on the operand is enough.
+        assert(self.sources[0] is self.dests[0])
 
         hbm = self.__mem_model.hbm
         spad = self.__mem_model.spad
@@ -200,10 +198,11 @@ class Instruction(MInstruction):
         Returns:
             str: The instruction in MInst ASM-ISA format.
         """
-        # Instruction sources
-        extra_args = tuple(src.toMASMISAFormat() for src in self.sources) + extra_args
         # Instruction destinations
-        extra_args = tuple(dst.toCASMISAFormat() for dst in self.dests) + extra_args
+        args = [dst.toCASMISAFormat() for dst in self.dests]
+        # Instruction sources
+        args.extend([src.toMASMISAFormat() for src in self.sources])
+        args.extend(extra_args)
         return self.toStringFormat(None,
                                    self.OP_NAME_ASM,
-                                   *extra_args)
\ No newline at end of file
+                                   *args)
\ No newline at end of file
@@ -1,3 +1,4 @@
+from assembler.common.config import GlobalConfig
 from assembler.common.cycle_tracking import CycleType
 from .minstruction import MInstruction
 from assembler.memory_model import MemoryModel
@@ -20,6 +21,8 @@ class Instruction(MInstruction):
         dst_hbm_addr (int): HBM address where to store the source variable.
     """
 
+    __slots__ = ('__mem_model', 'dst_hbm_addr', '__source_spad_address')
+
     @classmethod
     def _get_OP_NAME_ASM(cls) -> str:
         """
@@ -64,9 +67,9 @@ class Instruction(MInstruction):
         """
         if dst_hbm_addr < 0:
             raise ValueError('`dst_hbm_addr`: cannot be null address (negative).')
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
 
         super().__init__(id, throughput, latency, comment=comment)
@@ -80,10 +83,15 @@ class Instruction(MInstruction):
         """
         Returns a string representation of the Instruction object.
 
+        The form is selected by `GlobalConfig.debugVerbose`.
+
         Returns:
-            str: A string representation of the Instruction object, including 
+            str: A string representation of the Instruction object. If `GlobalConfig.debugVerbose` is not set,
+                 this is a short form with only its type, name, and ID. Otherwise, it is a verbose form including
                  its type, name, memory address, ID, source, destination HBM address, throughput, and latency.
         """
+        if not GlobalConfig.debugVerbose:
+            return f'<{type(self).__name__}({self.name})>(id={self.id})'
         assert(len(self.dests) > 0)
         retval=('<{}({}) object at {}>(id={}[0], '
                   'src={}, dst_hbm_addr={}, mem_model, '
@@ -121,12 +129,7 @@ class Instruction(MInstruction):
             ValueError: If the number of destinations is incorrect.
             TypeError: If the list does not contain `Variable` objects.
         """
-        if len(value) != Instruction._OP_NUM_DESTS:
-            raise ValueError(("`value`: Expected list of {} `Variable` objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of `Variable` objects.")
+        self._validateVarList(value, Instruction._OP_NUM_DESTS)
         super()._set_dests(value)
 
     def _set_sources(self, value):
@@ -140,12 +143,7 @@ class Instruction(MInstruction):
             ValueError: If the number of sources is incorrect.
             TypeError: If the list does not contain `Variable` objects.
         """
-        if len(value) != Instruction._OP_NUM_SOURCES:
-            raise ValueError(("`value`: Expected list of {} `Variable` objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of `Variable` objects.")
+        self._validateVarList(value, Instruction._OP_NUM_SOURCES)
         super()._set_sources(value)
 
     def _schedule(self, cycle_count: CycleType, schedule_id: int) -> int:
@@ -171,37 +169,42 @@ class Instruction(MInstruction):
         """
         assert(Instruction._OP_NUM_SOURCES > 0 and len(self.sources) == Instruction._OP_NUM_SOURCES)
         assert(Instruction._OP_NUM_DESTS > 0 and len(self.dests) == Instruction._OP_NUM_DESTS)
-        assert(all(src == dst for src, dst in zip(self.sources, self.dests)))
+        # The constructor sets sources and dests to the same variable, and neither list
+        # is replaced afterwards, so an identity check on the operand is enough.
+        assert(self.sources[0] is self.dests[0])
 
-        hbm = self.__mem_model.hbm
-        spad = self.__mem_model.spad
+        mem_model = self.__mem_model
+        hbm = mem_model.hbm
+        spad = mem_model.spad
+        dst_hbm_addr = self.dst_hbm_addr
 
         variable: Variable = self.sources[0]
-        if self.__source_spad_address < 0:
-            self.__source_spad_address = self.sources[0].spad_address
-
-        if variable.hbm_address >= 0:
-            if self.dst_hbm_addr != variable.hbm_address:
+        source_spad_address = self.__source_spad_address
+        if source_spad_address < 0:
+            source_spad_address = variable.spad_address
+            self.__source_spad_address = source_spad_address
+
+        variable_hbm_address = variable.hbm_address
+        if variable_hbm_address >= 0:
+            if dst_hbm_addr != variable_hbm_address:
                 raise RuntimeError("Source variable is already in different HBM location. Cannot store a variable into HBM more than once.")
-            assert(hbm.buffer[variable.hbm_address] == variable)
-        if self.__source_spad_address < 0:
+            assert(hbm.buffer[variable_hbm_address] == variable)
+        if source_spad_address < 0:
             raise RuntimeError("Null reference exception: source variable is not in SPAD.")
 
-        if self.comment:
-            self.comment += ';'
+        comment = self.comment
         # self.comment += ' variable "{}": HBM({}) <- SPAD({})'.format(variable.name,
         #                                                              self.dst_hbm_addr,
         #                                                              variable.spad_address)
-        self.comment += ' variable "{}" <- SPAD({})'.format(variable.name,
-                                                            variable.spad_address)
+        self.comment = f'{comment}{";" if comment else ""} variable "{variable.name}" <- SPAD({variable.spad_address})'
 
         retval = super()._schedule(cycle_count, schedule_id)
         # Perform the store
-        if variable.hbm_address < 0: # Variable new to HBM
-            hbm.allocateForce(self.dst_hbm_addr, variable)
-        spad.deallocate(self.__source_spad_address) # Deallocate variable from SPAD
+        if variable_hbm_address < 0: # Variable new to HBM
+            hbm.allocateForce(dst_hbm_addr, variable)
+        spad.deallocate(source_spad_address) # Deallocate variable from SPAD
         # Track SPAD access
-        spad_access_tracking = spad.getAccessTracking(self.__source_spad_address)
+        spad_access_tracking = spad.getAccessTracking(source_spad_address)
         spad_access_tracking.last_mstore = self
         # No need to track last CInst access after a `mstore`
         spad_access_tracking.last_cload = None
@@ -221,10 +224,11 @@ class Instruction(MInstruction):
         Returns:
             str: The instruction in MInst ASM-ISA format.
         """
-        # Instruction sources
-        extra_args = (self.__source_spad_address, ) + extra_args
         # Instruction destinations
-        extra_args = tuple(dst.toMASMISAFormat() for dst in self.dests) + extra_args
+        args = [dst.toMASMISAFormat() for dst in self.dests]
+        # Instruction sources
+        args.append(self.__source_spad_address)
+        args.extend(extra_args)
         return self.toStringFormat(None,
                                    self.OP_NAME_ASM,
-                                   *extra_args)
\ No newline at end of file
+                                   *args)
\ No newline at end of file
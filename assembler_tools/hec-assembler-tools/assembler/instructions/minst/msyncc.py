@@ -13,7 +13,9 @@ class Instruction(MInstruction):
     Attributes:
         cinstr: The instruction from the CINST queue for which to wait.
     """
-    
+
+    __slots__ = ('cinstr',)
+
     @classmethod
     def _get_OP_NAME_ASM(cls) -> str:
         """
@@ -45,9 +47,9 @@ class Instruction(MInstruction):
 
             comment (str, optional): A comment for the instruction. Defaults to an empty string.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
         super().__init__(id, throughput, latency, comment=comment)
         self.cinstr = cinstr # Instruction number from the MINST queue for which to wait
@@ -1,5 +1,6 @@
 ﻿from assembler.memory_model import MemoryModel
 from .xinstruction import XInstruction
+from .. import tokenizeFromLine
 from . import add, sub, mul, muli, mac, maci, ntt, intt, twntt, twintt, rshuffle, irshuffle, move, xstore, nop
 from . import exit as exit_mod
 from . import copy as copy_mod
@@ -29,6 +30,9 @@ Nop = nop.Instruction
 # Collection of XInstructions with P-ISA or intermediate P-ISA equivalents
 __PISA_INSTRUCTIONS = ( Add, Sub, Mul, Muli, Mac, Maci, NTT, iNTT, twNTT, twiNTT, rShuffle, irShuffle, Copy )
 
+# Maps P-ISA operation name to the XInstruction that parses it
+__PISA_DISPATCH = { inst_type.OP_NAME_PISA: inst_type for inst_type in __PISA_INSTRUCTIONS }
+
 # Collection of XInstructions with global cycle tracking
 GLOBAL_CYCLE_TRACKING_INSTRUCTIONS = ( rShuffle, irShuffle, XStore )
 
@@ -37,7 +41,7 @@ def createFromParsedObj(mem_model: MemoryModel,
                         parsed_op,
                         new_id: int = 0) -> XInstruction:
     """
-    Creates an XInstruction object XInst from the specified namespace data.
+    Creates an XInstruction object XInst from the specified parsed data.
 
     Variables are extracted from the memory model (or created if not existing) and
     added as destinations and sources to the instruction.
@@ -48,10 +52,12 @@ def createFromParsedObj(mem_model: MemoryModel,
             input string will be automatically added to the memory model if they do not already
             exist. The represented object may be modified if addition is needed.
         inst_type (type):
-            Type of the instruction to create. Constructor must be compatible with namespace `parsed_op`.
+            Type of the instruction to create. Constructor must be compatible with dictionary `parsed_op`.
             This type must be a class derived from `XInstruction`.
-        parsed_op (Namespace):
-            A namespace that is compatible with the instruction of type `inst_type` to create.
+        parsed_op (dict):
+            A dictionary of constructor arguments that is compatible with the instruction of type
+            `inst_type` to create. Its "dst" and "src" entries are replaced in place by the
+            corresponding `Variable` objects.
         new_id (int):
             Optional ID number for the instruction. Defaults to 0.
 
@@ -67,31 +73,20 @@ def createFromParsedObj(mem_model: MemoryModel,
 
     # Convert variable names into actual variable objects.
 
-    # Find the variables for dst.
-    dsts = []
-    for var_name, bank in parsed_op.dst:
-        # Retrieve variable from global list (or create new one if it doesn't exist).
-        var = mem_model.retrieveVarAdd(var_name, bank)
-        dsts.append(var)
-
-    # Find the variables for src.
-    srcs = []
-    for var_name, bank in parsed_op.src:
-        # Retrieve variable from global list (or create new one if it doesn't exist).
-        var = mem_model.retrieveVarAdd(var_name, bank)
-        srcs.append(var)
+    # Retrieve variables from global list (or create new ones if they don't exist).
+    retrieveVarAdd = mem_model.retrieveVarAdd
 
     # Prepare parsed object to add as arguments to instruction constructor.
-    parsed_op.dst = dsts
-    parsed_op.src = srcs
-    assert(parsed_op.op_name == inst_type.OP_NAME_PISA)
-    parsed_op = vars(parsed_op)
-    parsed_op.pop("op_name") # op name not needed: inst_type knows its name already
+    parsed_op["dst"] = [ retrieveVarAdd(var_name, bank) for var_name, bank in parsed_op["dst"] ]
+    parsed_op["src"] = [ retrieveVarAdd(var_name, bank) for var_name, bank in parsed_op["src"] ]
+    op_name = parsed_op.pop("op_name") # op name not needed: inst_type knows its name already
+    assert(op_name == inst_type.OP_NAME_PISA)
     return inst_type(new_id, **parsed_op)
 
 def createFromPISALine(mem_model: MemoryModel,
                        line: str,
-                       line_no: int = 0) -> XInstruction:
+                       line_no: int = 0,
+                       tokens: tuple = None) -> XInstruction:
     """
     Parses an XInst from the specified string (in P-ISA kernel input format) and returns a
     XInstruction object encapsulating the resulting instruction.
@@ -110,6 +105,10 @@ def createFromPISALine(mem_model: MemoryModel,
         line_no (int):
             Optional line number for the line. This will be used as ID for the parsed instruction.
             Defaults to 0.
+        tokens (tuple):
+            Optional tokens and comment for `line`, as returned by `tokenizeFromLine()`. Callers
+            that already tokenized the line pass them here to avoid tokenizing it again.
+            Defaults to None, in which case `line` is tokenized.
 
     Returns:
         XInstruction: A XInstruction derived object encapsulating the XInst equivalent to the parsed P-ISA
@@ -123,16 +122,16 @@ def createFromPISALine(mem_model: MemoryModel,
 
     try:
 
-        for inst_type in __PISA_INSTRUCTIONS:
-            parsed_op = inst_type.parseFromPISALine(line)
-            if parsed_op:
-                assert(inst_type.OP_NAME_PISA == parsed_op.op_name)
-
-                # Convert parsed instruction into an actual instruction object.
-                retval = createFromParsedObj(mem_model, inst_type, parsed_op, line_no)
+        # Tokenize once and dispatch on the operation name instead of
+        # letting every instruction type attempt to parse the line.
+        instr_tokens, comment = tokens if tokens else tokenizeFromLine(line)
+        inst_type = __PISA_DISPATCH.get(instr_tokens[1]) if len(instr_tokens) > 1 else None
+        if inst_type:
+            # `inst_type` was selected by `OP_NAME_PISA`, so the op name needs no further check here.
+            parsed_op = inst_type.parseFromPISATokens(instr_tokens, comment)
 
-                # Line parsed by an instruction: stop searching.
-                break
+            # Convert parsed instruction into an actual instruction object.
+            retval = createFromParsedObj(mem_model, inst_type, parsed_op, line_no)
 
     except Exception as ex:
         raise Exception(f'line {line_no}: {line}.') from ex
@@ -1,8 +1,4 @@
-﻿import warnings
-
-from argparse import Namespace
-
-from .xinstruction import XInstruction
+﻿from .xinstruction import XInstruction
 from assembler.memory_model.variable import Variable
 
 class Instruction(XInstruction):
@@ -21,6 +17,8 @@ class Instruction(XInstruction):
             Parses an `add` instruction from a Kernel instruction string.
     """
 
+    __slots__ = ()
+
     # To be initialized from ASM ISA spec
     _OP_NUM_TOKENS: int
 
@@ -51,7 +49,7 @@ class Instruction(XInstruction):
                 "13, add , output_0_1_3 (2), c_0_1_3 (0), d_0_1_3 (1), 1"
 
         Returns:
-            Namespace: A namespace with the following attributes:
+            dict: A dictionary with the following keys:
                 N (int): Ring size = Log_2(PMD)
                 op_name (str): Operation name ("add")
                 dst (list[(str, int)]): List of destinations of the form (variable_name, suggested_bank).
@@ -64,24 +62,7 @@ class Instruction(XInstruction):
         retval = None
         tokens = XInstruction.tokenizeFromPISALine(cls.OP_NAME_PISA, line)
         if tokens:
-            retval = { "comment": tokens[1] }
-            instr_tokens = tokens[0]
-            if len(instr_tokens) > cls._OP_NUM_TOKENS:
-                warnings.warn(f'Extra tokens detected for instruction "{cls.OP_NAME_PISA}"', SyntaxWarning)
-
-            retval["N"] = int(instr_tokens[0])
-            retval["op_name"] = instr_tokens[1]
-            params_start = 2
-            params_end = params_start + cls._OP_NUM_DESTS + cls._OP_NUM_SOURCES
-            dst_src = cls.parsePISASourceDestsFromTokens(instr_tokens,
-                                                         cls._OP_NUM_DESTS,
-                                                         cls._OP_NUM_SOURCES,
-                                                         params_start)
-            retval.update(dst_src)
-            retval["res"] = int(instr_tokens[params_end])
-
-            retval = Namespace(**retval)
-            assert(retval.op_name == cls.OP_NAME_PISA)
+            retval = cls.parseFromPISATokens(*tokens)
         return retval
 
     @classmethod
@@ -116,9 +97,9 @@ class Instruction(XInstruction):
             latency (int, optional): The latency of the instruction. Defaults to None.
             comment (str, optional): A comment associated with the instruction. Defaults to an empty string.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
 
         super().__init__(id, N, throughput, latency, res=res, comment=comment)
@@ -133,17 +114,9 @@ class Instruction(XInstruction):
         Returns:
             str: A string representation of object.
         """
-        retval=('<{}({}) object at {}>(id={}[0], res={}, '
-                  'dst={}, src={}, '
-                  'throughput={}, latency={})').format(type(self).__name__,
-                                                           self.name,
-                                                           hex(id(self)),
-                                                           self.id,
-                                                           self.res,
-                                                           self.dests,
-                                                           self.sources,
-                                                           self.throughput,
-                                                           self.latency)
+        retval=(f'<{type(self).__name__}({self.name}) object at {hex(id(self))}>(id={self.id}[0], res={self.res}, '
+                f'dst={self.dests}, src={self.sources}, '
+                f'throughput={self.throughput}, latency={self.latency})')
         return retval
 
     def _set_dests(self, value):
@@ -156,12 +129,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of `Variable` objects.
         """
-        if len(value) != Instruction._OP_NUM_DESTS:
-            raise ValueError(("`value`: Expected list of {} Variable objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_DESTS,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of Variable objects.")
+        self._validateVarList(value, Instruction._OP_NUM_DESTS)
         super()._set_dests(value)
 
     def _set_sources(self, value):
@@ -174,12 +142,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of `Variable` objects.
         """
-        if len(value) != Instruction._OP_NUM_SOURCES:
-            raise ValueError(("`value`: Expected list of {} Variable objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of Variable objects.")
+        self._validateVarList(value, Instruction._OP_NUM_SOURCES)
         super()._set_sources(value)
 
     def _toPISAFormat(self, *extra_args) -> str:
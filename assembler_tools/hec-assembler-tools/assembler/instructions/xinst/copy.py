@@ -1,7 +1,5 @@
 ﻿import warnings
 
-from argparse import Namespace
-
 from .xinstruction import XInstruction
 from assembler.memory_model.variable import Variable
 
@@ -11,6 +9,8 @@ class Instruction(XInstruction):
     a variable into another variable through registers.
     """
 
+    __slots__ = ()
+
     # To be initialized from ASM ISA spec
     _OP_NUM_TOKENS: int
 
@@ -71,7 +71,7 @@ class Instruction(XInstruction):
                 "13, copy, output_0_1_3 (2), c_0_1_3 (0), 0"
 
         Returns:
-            Namespace: A namespace with the following attributes:
+            dict: A dictionary with the following keys:
                 N (int): Ring size = Log_2(PMD)
                 op_name (str): Operation name ("copy")
                 dst (list[(str, int)]): List of destinations of the form (variable_name, suggested_bank).
@@ -84,34 +84,29 @@ class Instruction(XInstruction):
         retval = None
         tokens = XInstruction.tokenizeFromPISALine(cls.OP_NAME_PISA, line)
         if tokens:
-            retval = { "comment": tokens[1] }
-            instr_tokens = tokens[0]
-            if len(instr_tokens) > cls._OP_NUM_TOKENS:
-                warnings.warn(f'Extra tokens detected for instruction "{cls.OP_NAME_PISA}"', SyntaxWarning)
-
-            retval["N"] = int(instr_tokens[0])
-            retval["op_name"] = instr_tokens[1]
-            params_start = 2
-            params_end = params_start + cls._OP_NUM_DESTS + cls._OP_NUM_SOURCES
-            dst_src = cls.parsePISASourceDestsFromTokens(instr_tokens,
-                                                         cls._OP_NUM_DESTS,
-                                                         cls._OP_NUM_SOURCES,
-                                                         params_start)
-            retval.update(dst_src)
-            if len(instr_tokens) < cls._OP_NUM_TOKENS:
-                # temporary warning to avoid syntax error during testing
-                # REMOVE WARNING AND TURN IT TO ERROR DURING PRODUCTION
-                #---------------------------
-                warnings.warn(f'Not enough tokens detected for instruction "{cls.OP_NAME_PISA}"', SyntaxWarning)
-                pass
-            else:
-                # ignore "res", but make sure it exists (syntax)
-                assert(instr_tokens[params_end] is not None)
-
-            retval = Namespace(**retval)
-            assert(retval.op_name == cls.OP_NAME_PISA)
+            retval = cls.parseFromPISATokens(*tokens)
         return retval
 
+    @classmethod
+    def _parsePISAParamsFromTokens(cls, instr_tokens: tuple, params_end: int, parsed_op: dict):
+        """
+        Checks the res parameter of a `copy` instruction, which is not stored in `parsed_op`.
+
+        Parameters:
+            instr_tokens (tuple of str): Tokens for the instruction, as returned by `tokenizeFromLine()`.
+            params_end (int): Index in `instr_tokens` of the first token after the destinations and sources.
+            parsed_op (dict): Dictionary of parsed fields to update.
+        """
+        if len(instr_tokens) < cls._OP_NUM_TOKENS:
+            # temporary warning to avoid syntax error during testing
+            # REMOVE WARNING AND TURN IT TO ERROR DURING PRODUCTION
+            #---------------------------
+            warnings.warn(f'Not enough tokens detected for instruction "{cls.OP_NAME_PISA}"', SyntaxWarning)
+            pass
+        else:
+            # ignore "res", but make sure it exists (syntax)
+            assert(instr_tokens[params_end] is not None)
+
     def __init__(self,
                  id: int,
                  N: int,
@@ -135,9 +130,9 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the source and destination are the same.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
         N = 0 # does not require ring-size
         super().__init__(id, N, throughput, latency, comment=comment)
@@ -175,12 +170,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of `Variable` objects.
         """
-        if len(value) != Instruction._OP_NUM_DESTS:
-            raise ValueError(("`value`: Expected list of {} `Variable` objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of `Variable` objects.")
+        self._validateVarList(value, Instruction._OP_NUM_DESTS)
         super()._set_dests(value)
 
     def _set_sources(self, value):
@@ -193,12 +183,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of `Variable` objects.
         """
-        if len(value) != Instruction._OP_NUM_SOURCES:
-            raise ValueError(("`value`: Expected list of {} `Variable` objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of `Variable` objects.")
+        self._validateVarList(value, Instruction._OP_NUM_SOURCES)
         super()._set_sources(value)
 
     def _toPISAFormat(self, *extra_args) -> str:
@@ -11,6 +11,8 @@ class Instruction(XInstruction):
         https://github.com/IntelLabs/hec-assembler-tools/blob/master/docsrc/inst_spec/xinst/xinst_exit.md
     """
 
+    __slots__ = ()
+
     @classmethod
     def _get_OP_NAME_ASM(cls) -> str:
         """
@@ -35,9 +37,9 @@ class Instruction(XInstruction):
             latency (int, optional): The latency of the instruction. Defaults to None.
             comment (str, optional): A comment associated with the instruction. Defaults to an empty string.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
         N = 0
         super().__init__(id, N, throughput, latency, comment=comment)
@@ -49,13 +51,8 @@ class Instruction(XInstruction):
         Returns:
             str: A string representation.
         """
-        retval=('<{}({}) object at {}>(id={}[0], '
-                  'throughput={}, latency={})').format(type(self).__name__,
-                                                           self.name,
-                                                           hex(id(self)),
-                                                           self.id,
-                                                           self.throughput,
-                                                           self.latency)
+        retval=(f'<{type(self).__name__}({self.name}) object at {hex(id(self))}>(id={self.id}[0], '
+                f'throughput={self.throughput}, latency={self.latency})')
         return retval
 
     def _set_dests(self, value):
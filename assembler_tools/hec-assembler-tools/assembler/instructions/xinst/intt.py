@@ -1,8 +1,4 @@
-﻿import warnings
-
-from argparse import Namespace
-
-from .xinstruction import XInstruction
+﻿from .xinstruction import XInstruction
 from assembler.memory_model.variable import Variable
 
 class Instruction(XInstruction):
@@ -21,8 +17,12 @@ class Instruction(XInstruction):
     Methods:
         parseFromPISALine(line: str) -> object:
             Parses an `intt` instruction from a pre-processed Kernel instruction string.
+        _parsePISAParamsFromTokens(instr_tokens: tuple, params_end: int, parsed_op: dict):
+            Parses the parameters that follow the destinations and sources in P-ISA format.
     """
 
+    __slots__ = ('__stage',)
+
     # To be initialized from ASM ISA spec
     _OP_NUM_TOKENS: int
 
@@ -56,7 +56,7 @@ class Instruction(XInstruction):
                 "15, intt, outtmp_9_0 (2), outtmp_9_2 (3), output_9_0 (2), output_9_1 (3), w_gen_17_1 (1), 1, 9"
 
         Returns:
-            Namespace: A namespace with the following attributes:
+            dict: A dictionary with the following keys:
                 N (int): Ring size = Log_2(PMD)
                 op_name (str): Operation name ("intt")
                 dst (list[(str, int)]): List of destinations of the form (variable_name, suggested_bank).
@@ -72,27 +72,22 @@ class Instruction(XInstruction):
         retval = None
         tokens = XInstruction.tokenizeFromPISALine(cls.OP_NAME_PISA, line)
         if tokens:
-            retval = { "comment": tokens[1] }
-            instr_tokens = tokens[0]
-            if len(instr_tokens) > cls._OP_NUM_TOKENS:
-                warnings.warn(f'Extra tokens detected for instruction "{cls.OP_NAME_PISA}"', SyntaxWarning)
-
-            retval["N"] = int(instr_tokens[0])
-            retval["op_name"] = instr_tokens[1]
-            params_start = 2
-            params_end = params_start + cls._OP_NUM_DESTS + cls._OP_NUM_SOURCES
-            dst_src = cls.parsePISASourceDestsFromTokens(instr_tokens,
-                                                         cls._OP_NUM_DESTS,
-                                                         cls._OP_NUM_SOURCES,
-                                                         params_start)
-            retval.update(dst_src)
-            retval["stage"] = int(instr_tokens[params_end])
-            retval["res"] = int(instr_tokens[params_end + 1])
-
-            retval = Namespace(**retval)
-            assert(retval.op_name == cls.OP_NAME_PISA)
+            retval = cls.parseFromPISATokens(*tokens)
         return retval
 
+    @classmethod
+    def _parsePISAParamsFromTokens(cls, instr_tokens: tuple, params_end: int, parsed_op: dict):
+        """
+        Parses the stage and res parameters of an `intt` instruction into `parsed_op`.
+
+        Parameters:
+            instr_tokens (tuple of str): Tokens for the instruction, as returned by `tokenizeFromLine()`.
+            params_end (int): Index in `instr_tokens` of the first token after the destinations and sources.
+            parsed_op (dict): Dictionary of parsed fields to update.
+        """
+        parsed_op["stage"] = int(instr_tokens[params_end])
+        parsed_op["res"] = int(instr_tokens[params_end + 1])
+
     @classmethod
     def _get_OP_NAME_ASM(cls) -> str:
         """
@@ -127,9 +122,9 @@ class Instruction(XInstruction):
             throughput (int, optional): The throughput of the instruction. Defaults to None.
             latency (int, optional): The latency of the instruction. Defaults to None.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
 
         super().__init__(id, N, throughput, latency, res=res, comment=comment)
@@ -145,17 +140,9 @@ class Instruction(XInstruction):
         Returns:
             str: A string representation of the Instruction object.
         """
-        retval=('<{}({}) object at {}>(id={}[0], res={}, '
-                  'dst={}, src={}, '
-                  'throughput={}, latency={})').format(type(self).__name__,
-                                                           self.name,
-                                                           hex(id(self)),
-                                                           self.id,
-                                                           self.res,
-                                                           self.dests,
-                                                           self.sources,
-                                                           self.throughput,
-                                                           self.latency)
+        retval=(f'<{type(self).__name__}({self.name}) object at {hex(id(self))}>(id={self.id}[0], res={self.res}, '
+                f'dst={self.dests}, src={self.sources}, '
+                f'throughput={self.throughput}, latency={self.latency})')
         return retval
 
     @property
@@ -178,12 +165,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of Variable objects.
         """
-        if len(value) != Instruction._OP_NUM_DESTS:
-            raise ValueError(("`value`: Expected list of {} Variable objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_DESTS,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of Variable objects.")
+        self._validateVarList(value, Instruction._OP_NUM_DESTS)
         super()._set_dests(value)
 
     def _set_sources(self, value):
@@ -196,12 +178,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of Variable objects.
         """
-        if len(value) != Instruction._OP_NUM_SOURCES:
-            raise ValueError(("`value`: Expected list of {} Variable objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of Variable objects.")
+        self._validateVarList(value, Instruction._OP_NUM_SOURCES)
         super()._set_sources(value)
 
     def _toPISAFormat(self, *extra_args) -> str:
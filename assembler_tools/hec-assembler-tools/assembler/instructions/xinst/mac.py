@@ -1,8 +1,4 @@
-﻿import warnings
-
-from argparse import Namespace
-
-from .xinstruction import XInstruction
+﻿from .xinstruction import XInstruction
 from assembler.memory_model.variable import Variable
 
 class Instruction(XInstruction):
@@ -19,6 +15,8 @@ class Instruction(XInstruction):
         parseFromPISALine: Parses a `mac` instruction from a Kernel instruction string.
     """
     
+    __slots__ = ()
+
     # To be initialized from ASM ISA spec
     _OP_NUM_TOKENS: int
 
@@ -62,7 +60,7 @@ class Instruction(XInstruction):
 
                 Element `Instruction` is this class.
 
-                Element `parsed_op` is a namespace with the following attributes:
+                Element `parsed_op` is a dictionary with the following keys:
                 - N (int): Ring size = Log_2(PMD)
                 - op_name (str): Operation name ("mac")
                 - dst (list of tuples): List of destinations of the form (variable_name, suggested_bank).
@@ -75,24 +73,7 @@ class Instruction(XInstruction):
         retval = None
         tokens = XInstruction.tokenizeFromPISALine(cls.OP_NAME_PISA, line)
         if tokens:
-            retval = {"comment": tokens[1]}
-            instr_tokens = tokens[0]
-            if len(instr_tokens) > cls._OP_NUM_TOKENS:
-                warnings.warn(f'Extra tokens detected for instruction "{cls.OP_NAME_PISA}"', SyntaxWarning)
-
-            retval["N"] = int(instr_tokens[0])
-            retval["op_name"] = instr_tokens[1]
-            params_start = 2
-            params_end = params_start + cls._OP_NUM_DESTS + cls._OP_NUM_PISA_SOURCES
-            dst_src = cls.parsePISASourceDestsFromTokens(instr_tokens,
-                                                         cls._OP_NUM_DESTS,
-                                                         cls._OP_NUM_PISA_SOURCES,
-                                                         params_start)
-            retval.update(dst_src)
-            retval["res"] = int(instr_tokens[params_end])
-
-            retval = Namespace(**retval)
-            assert(retval.op_name == cls.OP_NAME_PISA)
+            retval = cls.parseFromPISATokens(*tokens)
         return retval
 
     @classmethod
@@ -135,15 +116,15 @@ class Instruction(XInstruction):
             comment (str, optional): 
                 An optional comment for the instruction.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
 
         super().__init__(id, N, throughput, latency, res=res, comment=comment)
 
         self._set_dests(dst)
-        self._set_sources([self.dests[0]] + src)
+        self._set_sources([self.dests[0], *src])
 
     def __repr__(self):
         """
@@ -175,12 +156,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of Variable objects.
         """
-        if len(value) != Instruction._OP_NUM_DESTS:
-            raise ValueError(("`value`: Expected list of {} Variable objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_DESTS,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of Variable objects.")
+        self._validateVarList(value, Instruction._OP_NUM_DESTS)
         super()._set_dests(value)
 
     def _set_sources(self, value):
@@ -193,12 +169,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of Variable objects.
         """
-        if len(value) != Instruction._OP_NUM_SOURCES:
-            raise ValueError(("`value`: Expected list of {} Variable objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of Variable objects.")
+        self._validateVarList(value, Instruction._OP_NUM_SOURCES)
         super()._set_sources(value)
 
     def _toPISAFormat(self, *extra_args) -> str:
@@ -221,13 +192,14 @@ class Instruction(XInstruction):
             raise ValueError('`extra_args` not supported.')
 
         preamble = (self.N,)
-        extra_args = tuple(src.toPISAFormat() for src in self.sources[1:]) + extra_args
-        extra_args = tuple(dst.toPISAFormat() for dst in self.dests) + extra_args
+        # dst, src1, src2, res: sources[0] is dst, which P-ISA does not repeat
+        args = [ dst.toPISAFormat() for dst in self.dests ]
+        args.extend([ src.toPISAFormat() for src in self.sources[1:] ])
         if self.res is not None:
-            extra_args += (self.res,)
+            args.append(self.res)
         return self.toStringFormat(preamble,
                                    self.OP_NAME_PISA,
-                                   *extra_args)
+                                   *args)
 
     def _toXASMISAFormat(self, *extra_args) -> str:
         """
@@ -1,8 +1,4 @@
-﻿import warnings
-
-from argparse import Namespace
-
-from .xinstruction import XInstruction
+﻿from .xinstruction import XInstruction
 from assembler.memory_model.variable import Variable
 
 class Instruction(XInstruction):
@@ -16,6 +12,8 @@ class Instruction(XInstruction):
         https://github.com/IntelLabs/hec-assembler-tools/blob/master/docsrc/inst_spec/xinst/xinst_maci.md
     """
 
+    __slots__ = ('__imm',)
+
     # To be initialized from ASM ISA spec
     _OP_NUM_TOKENS: int
 
@@ -59,7 +57,7 @@ class Instruction(XInstruction):
 
                 Element `Instruction` is this class.
 
-                Element `parsed_op` is a namespace with the following attributes:
+                Element `parsed_op` is a dictionary with the following keys:
                 - N (int): Ring size = Log_2(PMD)
                 - op_name (str): Operation name ("maci")
                 - dst (list of tuples): List of destinations of the form (variable_name, suggested_bank).
@@ -73,27 +71,22 @@ class Instruction(XInstruction):
         retval = None
         tokens = XInstruction.tokenizeFromPISALine(cls.OP_NAME_PISA, line)
         if tokens:
-            retval = {"comment": tokens[1]}
-            instr_tokens = tokens[0]
-            if len(instr_tokens) > cls._OP_NUM_TOKENS:
-                warnings.warn(f'Extra tokens detected for instruction "{cls.OP_NAME_PISA}"', SyntaxWarning)
-
-            retval["N"] = int(instr_tokens[0])
-            retval["op_name"] = instr_tokens[1]
-            params_start = 2
-            params_end = params_start + cls._OP_NUM_DESTS + cls._OP_NUM_PISA_SOURCES
-            dst_src = cls.parsePISASourceDestsFromTokens(instr_tokens,
-                                                         cls._OP_NUM_DESTS,
-                                                         cls._OP_NUM_PISA_SOURCES,
-                                                         params_start)
-            retval.update(dst_src)
-            retval["imm"] = instr_tokens[params_end]
-            retval["res"] = int(instr_tokens[params_end + 1])
-
-            retval = Namespace(**retval)
-            assert(retval.op_name == cls.OP_NAME_PISA)
+            retval = cls.parseFromPISATokens(*tokens)
         return retval
 
+    @classmethod
+    def _parsePISAParamsFromTokens(cls, instr_tokens: tuple, params_end: int, parsed_op: dict):
+        """
+        Parses the imm and res parameters of a `maci` instruction into `parsed_op`.
+
+        Parameters:
+            instr_tokens (tuple of str): Tokens for the instruction, as returned by `tokenizeFromLine()`.
+            params_end (int): Index in `instr_tokens` of the first token after the destinations and sources.
+            parsed_op (dict): Dictionary of parsed fields to update.
+        """
+        parsed_op["imm"] = instr_tokens[params_end]
+        parsed_op["res"] = int(instr_tokens[params_end + 1])
+
     @classmethod
     def _get_OP_NAME_ASM(cls) -> str:
         """
@@ -137,16 +130,16 @@ class Instruction(XInstruction):
             latency (int, optional): 
                 The latency of the instruction. Defaults to the class-level default if not provided.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
 
         super().__init__(id, N, throughput, latency, res=res, comment=comment)
 
         self.__imm = imm  # (Read-only) immediate
         self._set_dests(dst)
-        self._set_sources([self.dests[0]] + src)
+        self._set_sources([self.dests[0], *src])
 
     def __repr__(self):
         """
@@ -155,18 +148,9 @@ class Instruction(XInstruction):
         Returns:
             str: A string representation of the object.
         """
-        retval = ('<{}({}) object at {}>(id={}[0], res={}, imm={}, '
-                  'dst={}, src={}, '
-                  'throughput={}, latency={})').format(type(self).__name__,
-                                                       self.name,
-                                                       hex(id(self)),
-                                                       self.id,
-                                                       self.res,
-                                                       self.imm,
-                                                       self.dests,
-                                                       self.sources,
-                                                       self.throughput,
-                                                       self.latency)
+        retval = (f'<{type(self).__name__}({self.name}) object at {hex(id(self))}>(id={self.id}[0], res={self.res}, imm={self.imm}, '
+                  f'dst={self.dests}, src={self.sources}, '
+                  f'throughput={self.throughput}, latency={self.latency})')
         return retval
 
     @property
@@ -189,12 +173,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of Variable objects.
         """
-        if len(value) != Instruction._OP_NUM_DESTS:
-            raise ValueError(("`value`: Expected list of {} Variable objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_DESTS,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of Variable objects.")
+        self._validateVarList(value, Instruction._OP_NUM_DESTS)
         super()._set_dests(value)
 
     def _set_sources(self, value):
@@ -207,12 +186,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of Variable objects.
         """
-        if len(value) != Instruction._OP_NUM_SOURCES:
-            raise ValueError(("`value`: Expected list of {} Variable objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of Variable objects.")
+        self._validateVarList(value, Instruction._OP_NUM_SOURCES)
         super()._set_sources(value)
 
     def _toPISAFormat(self, *extra_args) -> str:
@@ -234,16 +208,17 @@ class Instruction(XInstruction):
         if extra_args:
             raise ValueError('`extra_args` not supported.')
 
-        # N, muli, dst (bank), src0 (bank), imm, res # comment
+        # N, maci, dst (bank), src0 (bank), imm, res # comment
         preamble = (self.N,)
-        extra_args = (self.imm,)
-        extra_args = tuple(src.toPISAFormat() for src in self.sources[1:]) + extra_args
-        extra_args = tuple(dst.toPISAFormat() for dst in self.dests) + extra_args
+        # sources[0] is dst, which P-ISA does not repeat
+        args = [ dst.toPISAFormat() for dst in self.dests ]
+        args.extend([ src.toPISAFormat() for src in self.sources[1:] ])
+        args.append(self.imm)
         if self.res is not None:
-            extra_args += (self.res,)
+            args.append(self.res)
         return self.toStringFormat(preamble,
                                    self.OP_NAME_PISA,
-                                   *extra_args)
+                                   *args)
 
     def _toXASMISAFormat(self, *extra_args) -> str:
         """
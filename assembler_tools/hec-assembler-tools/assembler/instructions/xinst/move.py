@@ -14,6 +14,8 @@ class Instruction(XInstruction):
         https://github.com/IntelLabs/hec-assembler-tools/blob/master/docsrc/inst_spec/xinst/xinst_move.md
     """
 
+    __slots__ = ('__dummy_var',)
+
     @classmethod
     def _get_OP_NAME_ASM(cls) -> str:
         """
@@ -55,9 +57,9 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If a dummy variable is used as a source or if the destination register is not empty.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
         if any(isinstance(v, DummyVariable) or not v.name for v in src):
             raise ValueError(f"{Instruction.OP_NAME_ASM} cannot have dummy variable as source.")
@@ -79,16 +81,9 @@ class Instruction(XInstruction):
         Returns:
             str: A string representation of the object.
         """
-        retval = ('<{}({}) object at {}>(id={}[0], '
-                  'dst={}, src={}, '
-                  'throughput={}, latency={})').format(type(self).__name__,
-                                                       self.name,
-                                                       hex(id(self)),
-                                                       self.id,
-                                                       self.dests,
-                                                       self.sources,
-                                                       self.throughput,
-                                                       self.latency)
+        retval = (f'<{type(self).__name__}({self.name}) object at {hex(id(self))}>(id={self.id}[0], '
+                  f'dst={self.dests}, src={self.sources}, '
+                  f'throughput={self.throughput}, latency={self.latency})')
         return retval
 
     def _set_dests(self, value):
@@ -120,12 +115,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of Variable objects.
         """
-        if len(value) != Instruction._OP_NUM_SOURCES:
-            raise ValueError(("`value`: Expected list of {} `Variable` objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of `Variable` objects.")
+        self._validateVarList(value, Instruction._OP_NUM_SOURCES)
         super()._set_sources(value)
 
     def _schedule(self, cycle_count: CycleType, schedule_id: int) -> int:
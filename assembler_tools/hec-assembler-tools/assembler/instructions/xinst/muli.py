@@ -1,8 +1,4 @@
-﻿import warnings
-
-from argparse import Namespace
-
-from .xinstruction import XInstruction
+﻿from .xinstruction import XInstruction
 from assembler.memory_model.variable import Variable
 
 class Instruction(XInstruction):
@@ -17,9 +13,12 @@ class Instruction(XInstruction):
 
     Methods:
         parseFromPISALine: Parses a `muli` instruction from a Kernel instruction string.
+        _parsePISAParamsFromTokens: Parses the parameters that follow the destinations and sources in P-ISA format.
         imm: Property to get the immediate value identifier.
     """
 
+    __slots__ = ('__imm',)
+
     # To be initialized from ASM ISA spec
     _OP_NUM_TOKENS: int
 
@@ -55,7 +54,7 @@ class Instruction(XInstruction):
 
                 Element `Instruction` is this class.
 
-                Element `parsed_op` is a namespace with the following attributes:
+                Element `parsed_op` is a dictionary with the following keys:
                     - N (int): Ring size = Log_2(PMD)
                     - op_name (str): Operation name ("muli")
                     - dst (list of tuples): List of destinations of the form (variable_name, suggested_bank).
@@ -69,27 +68,22 @@ class Instruction(XInstruction):
         retval = None
         tokens = XInstruction.tokenizeFromPISALine(cls.OP_NAME_PISA, line)
         if tokens:
-            retval = {"comment": tokens[1]}
-            instr_tokens = tokens[0]
-            if len(instr_tokens) > cls._OP_NUM_TOKENS:
-                warnings.warn(f'Extra tokens detected for instruction "{cls.OP_NAME_PISA}"', SyntaxWarning)
-
-            retval["N"] = int(instr_tokens[0])
-            retval["op_name"] = instr_tokens[1]
-            params_start = 2
-            params_end = params_start + cls._OP_NUM_DESTS + cls._OP_NUM_SOURCES
-            dst_src = cls.parsePISASourceDestsFromTokens(instr_tokens,
-                                                         cls._OP_NUM_DESTS,
-                                                         cls._OP_NUM_SOURCES,
-                                                         params_start)
-            retval.update(dst_src)
-            retval["imm"] = instr_tokens[params_end]
-            retval["res"] = int(instr_tokens[params_end + 1])
-
-            retval = Namespace(**retval)
-            assert(retval.op_name == cls.OP_NAME_PISA)
+            retval = cls.parseFromPISATokens(*tokens)
         return retval
 
+    @classmethod
+    def _parsePISAParamsFromTokens(cls, instr_tokens: tuple, params_end: int, parsed_op: dict):
+        """
+        Parses the imm and res parameters of a `muli` instruction into `parsed_op`.
+
+        Parameters:
+            instr_tokens (tuple of str): Tokens for the instruction, as returned by `tokenizeFromLine()`.
+            params_end (int): Index in `instr_tokens` of the first token after the destinations and sources.
+            parsed_op (dict): Dictionary of parsed fields to update.
+        """
+        parsed_op["imm"] = instr_tokens[params_end]
+        parsed_op["res"] = int(instr_tokens[params_end + 1])
+
     @classmethod
     def _get_OP_NAME_ASM(cls) -> str:
         """
@@ -124,9 +118,9 @@ class Instruction(XInstruction):
             latency (int, optional): The latency of the instruction. Defaults to the class-level default if not provided.
             comment (str, optional): An optional comment for the instruction.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
 
         super().__init__(id, N, throughput, latency, res=res, comment=comment)
@@ -142,18 +136,9 @@ class Instruction(XInstruction):
         Returns:
             str: A string representation of the object.
         """
-        retval = ('<{}({}) object at {}>(id={}[0], res={}, imm={}, '
-                  'dst={}, src={}, '
-                  'throughput={}, latency={})').format(type(self).__name__,
-                                                       self.name,
-                                                       hex(id(self)),
-                                                       self.id,
-                                                       self.res,
-                                                       self.imm,
-                                                       self.dests,
-                                                       self.sources,
-                                                       self.throughput,
-                                                       self.latency)
+        retval = (f'<{type(self).__name__}({self.name}) object at {hex(id(self))}>(id={self.id}[0], res={self.res}, imm={self.imm}, '
+                  f'dst={self.dests}, src={self.sources}, '
+                  f'throughput={self.throughput}, latency={self.latency})')
         return retval
 
     @property
@@ -176,12 +161,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of Variable objects.
         """
-        if len(value) != Instruction._OP_NUM_DESTS:
-            raise ValueError(("`value`: Expected list of {} Variable objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_DESTS,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of Variable objects.")
+        self._validateVarList(value, Instruction._OP_NUM_DESTS)
         super()._set_dests(value)
 
     def _set_sources(self, value):
@@ -194,12 +174,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the list does not contain the expected number of Variable objects.
         """
-        if len(value) != Instruction._OP_NUM_SOURCES:
-            raise ValueError(("`value`: Expected list of {} Variable objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of Variable objects.")
+        self._validateVarList(value, Instruction._OP_NUM_SOURCES)
         super()._set_sources(value)
 
     def _toPISAFormat(self, *extra_args) -> str:
@@ -11,6 +11,8 @@ class Instruction(XInstruction):
         https://github.com/IntelLabs/hec-assembler-tools/blob/master/docsrc/inst_spec/xinst/xinst_nop.md
     """
 
+    __slots__ = ()
+
     @classmethod
     def _get_OP_NAME_ASM(cls) -> str:
         """
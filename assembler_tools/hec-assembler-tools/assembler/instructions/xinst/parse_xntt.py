@@ -1,16 +1,16 @@
 ﻿import warnings
 
-from argparse import Namespace
-
 from assembler.common import constants
 from assembler.instructions import xinst
+from assembler.instructions import tokenizeFromLine
 from assembler.memory_model import MemoryModel
 
 __xntt_id = 0
 
 def parseXNTTKernelLine(line: str,
                         op_name: str,
-                        tw_separator: str) -> Namespace:
+                        tw_separator: str,
+                        tokens: tuple = None) -> dict:
     """
     Parses an `xntt` instruction from a P-ISA kernel instruction string.
 
@@ -23,8 +23,11 @@ def parseXNTTKernelLine(line: str,
 
         tw_separator (str): The separator used in the twiddle information.
 
+        tokens (tuple, optional): Tokens and comment for `line`, as returned by `tokenizeFromLine()`.
+                                  Defaults to None, in which case `line` is tokenized.
+
     Returns:
-        Namespace: A namespace with the following attributes:
+        dict: A dictionary with the following keys:
             N (int): Ring size = Log_2(PMD)
             op_name (str): Operation name
             dst (list of tuple): List of destinations of the form (variable_name, suggested_bank).
@@ -42,10 +45,9 @@ def parseXNTTKernelLine(line: str,
     OP_NUM_TOKENS  = 8
 
     retval = None
-    tokens = xinst.XInstruction.tokenizeFromPISALine(op_name, line)
-    if tokens:
-        retval = {"comment": tokens[1]}
-        instr_tokens = tokens[0]
+    instr_tokens, comment = tokens if tokens else tokenizeFromLine(line)
+    if len(instr_tokens) > 1 and instr_tokens[1] == op_name:
+        retval = {"comment": comment}
 
         if len(instr_tokens) > OP_NUM_TOKENS:
             warnings.warn(f'Extra tokens detected for instruction "{op_name}"', SyntaxWarning)
@@ -54,11 +56,10 @@ def parseXNTTKernelLine(line: str,
         retval["op_name"] = instr_tokens[1]
         params_start = 2
         params_end = params_start + OP_NUM_DESTS + OP_NUM_SOURCES
-        dst_src = xinst.XInstruction.parsePISASourceDestsFromTokens(instr_tokens,
-                                                                    OP_NUM_DESTS,
-                                                                    OP_NUM_SOURCES,
-                                                                    params_start)
-        retval.update(dst_src)
+        retval["dst"], retval["src"] = xinst.XInstruction.parsePISASourceDestsFromTokens(instr_tokens,
+                                                                                         OP_NUM_DESTS,
+                                                                                         OP_NUM_SOURCES,
+                                                                                         params_start)
         twiddle = instr_tokens[params_end]
         retval["res"] = int(instr_tokens[params_end + 1])
 
@@ -73,37 +74,36 @@ def parseXNTTKernelLine(line: str,
         retval["stage"] = int(twiddle_tokens[2])
         retval["block"] = int(twiddle_tokens[3])
 
-        retval = Namespace(**retval)
-        assert(retval.op_name == op_name)
+        assert(retval["op_name"] == op_name)
     return retval
 
-def __generateRMoveParsedOp(kntt_parsed_op: Namespace) -> (type, Namespace):
+def __generateRMoveParsedOp(kntt_parsed_op: dict) -> (type, dict):
     """
-    Generates a namespace compatible with xrshuffle XInst constructor.
+    Generates a dictionary compatible with xrshuffle XInst constructor.
 
     Parameters:
-        kntt_parsed_op (Namespace): Parsed xntt object (Namespace).
+        kntt_parsed_op (dict): Parsed xntt object (dict).
 
     Returns:
-        tuple: A tuple containing the xrshuffle type and a Namespace with the parsed operation.
+        tuple: A tuple containing the xrshuffle type and a dictionary with the parsed operation.
     """
     xrshuffle_type = None
     parsed_op = {}
-    parsed_op["N"] = kntt_parsed_op.N
+    parsed_op["N"] = kntt_parsed_op["N"]
     parsed_op["op_name"] = ""
     parsed_op["wait_cyc"] = 0
     parsed_op["dst"] = []
     parsed_op["src"] = []
     parsed_op["comment"] = ""
 
-    if kntt_parsed_op.op_name == xinst.NTT.OP_NAME_PISA:
+    if kntt_parsed_op["op_name"] == xinst.NTT.OP_NAME_PISA:
         xrshuffle_type = xinst.rShuffle
-        parsed_op["dst"] = [d for d in kntt_parsed_op.dst]
-    elif kntt_parsed_op.op_name == xinst.iNTT.OP_NAME_PISA:
+        parsed_op["dst"] = [d for d in kntt_parsed_op["dst"]]
+    elif kntt_parsed_op["op_name"] == xinst.iNTT.OP_NAME_PISA:
         xrshuffle_type = xinst.irShuffle
-        parsed_op["dst"] = [s for s in kntt_parsed_op.src]
+        parsed_op["dst"] = [s for s in kntt_parsed_op["src"]]
     else:
-        raise ValueError('`kntt_parsed_op`: cannot process operation with name "{}".'.format(kntt_parsed_op.op_name))
+        raise ValueError('`kntt_parsed_op`: cannot process operation with name "{}".'.format(kntt_parsed_op["op_name"]))
 
     assert(xrshuffle_type)
 
@@ -111,17 +111,17 @@ def __generateRMoveParsedOp(kntt_parsed_op: Namespace) -> (type, Namespace):
     parsed_op["op_name"] = xrshuffle_type.OP_NAME_PISA
 
     # rshuffle goes above corresponding intt or below corresponding ntt
-    return xrshuffle_type, Namespace(**parsed_op)
+    return xrshuffle_type, parsed_op
 
-def __generateTWNTTParsedOp(xntt_parsed_op: Namespace) -> Namespace:
+def __generateTWNTTParsedOp(xntt_parsed_op: dict) -> tuple:
     """
-    Generates a namespace compatible with twxntt XInst constructor.
+    Generates a dictionary compatible with twxntt XInst constructor.
 
     Parameters:
-        xntt_parsed_op (Namespace): Parsed kernel xntt object (Namespace).
+        xntt_parsed_op (dict): Parsed kernel xntt object (dict).
 
     Returns:
-        tuple: A tuple containing the twxntt type, a Namespace with the parsed operation, and a tuple with the twiddle variable name and suggested bank.
+        tuple: A tuple containing the twxntt type, a dictionary with the parsed operation, and a tuple with the twiddle variable name and suggested bank.
                The twxntt type is None if a twxntt is not needed for the specified xntt.
     """
     global __xntt_id # TODO: replace by unique ID once it gets integrated into the P-ISA kernel.
@@ -129,11 +129,11 @@ def __generateTWNTTParsedOp(xntt_parsed_op: Namespace) -> Namespace:
     retval = None
 
     parsed_op = {}
-    parsed_op["N"] = xntt_parsed_op.N
-    parsed_op["op_name"] = 'tw' + str(xntt_parsed_op.op_name)
-    parsed_op["res"] = xntt_parsed_op.res
-    parsed_op["stage"] = xntt_parsed_op.stage
-    parsed_op["block"] = xntt_parsed_op.block
+    parsed_op["N"] = xntt_parsed_op["N"]
+    parsed_op["op_name"] = 'tw' + str(xntt_parsed_op["op_name"])
+    parsed_op["res"] = xntt_parsed_op["res"]
+    parsed_op["stage"] = xntt_parsed_op["stage"]
+    parsed_op["block"] = xntt_parsed_op["block"]
     parsed_op["dst"] = []
     parsed_op["src"] = []
     parsed_op["tw_meta"] = 0
@@ -192,10 +192,10 @@ def __generateTWNTTParsedOp(xntt_parsed_op: Namespace) -> Namespace:
         retval = twxntt_type
     # else None
 
-    return retval, Namespace(**parsed_op), tw_var_name_bank
+    return retval, parsed_op, tw_var_name_bank
 
 def generateXNTT(mem_model: MemoryModel,
-                 xntt_parsed_op: Namespace,
+                 xntt_parsed_op: dict,
                  new_id: int = 0) -> list:
     """
     Parses an `xntt` instruction from a P-ISA kernel instruction string.
@@ -205,7 +205,7 @@ def generateXNTT(mem_model: MemoryModel,
                                  input string will be automatically added to the memory model if they do not already
                                  exist. The represented object may be modified if addition is needed.
 
-        xntt_parsed_op (Namespace): Namespace of parsed xntt from P-ISA.
+        xntt_parsed_op (dict): Dictionary of parsed xntt from P-ISA.
 
         new_id (int, optional): A new ID for the instruction. Defaults to 0.
 
@@ -216,9 +216,9 @@ def generateXNTT(mem_model: MemoryModel,
     retval = []
 
     # Find xntt type depending on whether we are doing ntt or intt
-    xntt_type = next((t for t in (xinst.NTT, xinst.iNTT) if t.OP_NAME_PISA == xntt_parsed_op.op_name), None)
+    xntt_type = next((t for t in (xinst.NTT, xinst.iNTT) if t.OP_NAME_PISA == xntt_parsed_op["op_name"]), None)
     if not xntt_type:
-        raise ValueError('`xntt_parsed_op`: cannot process parsed kernel operation with name "{}".'.format(xntt_parsed_op.op_name))
+        raise ValueError('`xntt_parsed_op`: cannot process parsed kernel operation with name "{}".'.format(xntt_parsed_op["op_name"]))
 
     # Generate twiddle instruction
     #-----------------------------
@@ -233,7 +233,7 @@ def generateXNTT(mem_model: MemoryModel,
     #-----------------------------
 
     rshuffle_type, rshuffle_parsed_op = __generateRMoveParsedOp(xntt_parsed_op)
-    rshuffle_parsed_op.comment += (" " + twxntt_parsed_op.comment) if twxntt_parsed_op else ""
+    rshuffle_parsed_op["comment"] += (" " + twxntt_parsed_op["comment"]) if twxntt_parsed_op else ""
     rshuffle_inst = xinst.createFromParsedObj(mem_model, rshuffle_type, rshuffle_parsed_op, new_id)
 
     # Generate xntt instruction
@@ -241,10 +241,10 @@ def generateXNTT(mem_model: MemoryModel,
 
     # Prepare arguments for ASM ntt instruction object construction
     if twxntt_parsed_op:
-        assert(twxntt_parsed_op.stage == xntt_parsed_op.stage)
-    delattr(xntt_parsed_op, "block")
-    xntt_parsed_op.src.append(last_twxinput_name)
-    xntt_parsed_op.comment += twxntt_parsed_op.comment if twxntt_parsed_op else ""
+        assert(twxntt_parsed_op["stage"] == xntt_parsed_op["stage"])
+    del xntt_parsed_op["block"]
+    xntt_parsed_op["src"].append(last_twxinput_name)
+    xntt_parsed_op["comment"] += twxntt_parsed_op["comment"] if twxntt_parsed_op else ""
 
     # Create instruction
     xntt_inst = xinst.createFromParsedObj(mem_model, xntt_type, xntt_parsed_op, new_id)
@@ -1,7 +1,4 @@
-﻿import warnings
-from argparse import Namespace
-
-from assembler.common.cycle_tracking import CycleType
+﻿from assembler.common.cycle_tracking import CycleType
 from assembler.common.decorators import *
 from .xinstruction import XInstruction
 from assembler.memory_model.variable import Variable
@@ -17,10 +14,13 @@ class Instruction(XInstruction):
         SpecialLatencyIncrement: Returns the increment for special latency for rshuffle instructions.
         RSHUFFLE_DATA_TYPE: Returns the data type for rshuffle instructions.
         parseFromPISALine: Parses an `rshuffle` instruction from a pre-processed Kernel instruction string.
+        _parsePISAParamsFromTokens: Parses the parameters that follow the destinations and sources in P-ISA format.
         set_irshuffleGlobalCycleReady: Sets the global cycle ready based on the last irshuffle.
         reset_GlobalCycleReady: Resets the global cycle ready for rshuffle and irshuffle instructions.
     """
 
+    __slots__ = ('wait_cyc',)
+
     # To be initialized from ASM ISA spec
     _OP_NUM_TOKENS       : int
     _OP_RMOVE_LATENCY    : int
@@ -114,7 +114,7 @@ class Instruction(XInstruction):
                         "13, rshuffle, outtmp_9_0 (2), outtmp_9_2 (3), outtmp_9_0 (2), outtmp_9_2 (3), 0"
 
         Returns:
-            Namespace: A namespace with the following attributes:
+            dict: A dictionary with the following keys:
                 N (int): Ring size = Log_2(PMD)
                 op_name (str): Operation name ("rshuffle")
                 dst (list of tuple): List of destinations of the form (variable_name, suggested_bank).
@@ -128,27 +128,23 @@ class Instruction(XInstruction):
         retval = None
         tokens = XInstruction.tokenizeFromPISALine(cls.OP_NAME_PISA, line)
         if tokens:
-            retval = {"comment": tokens[1]}
-            instr_tokens = tokens[0]
-            if len(instr_tokens) > cls._OP_NUM_TOKENS:
-                warnings.warn(f'Extra tokens detected for instruction "{cls.OP_NAME_PISA}"', SyntaxWarning)
-
-            retval["N"] = int(instr_tokens[0])
-            retval["op_name"] = instr_tokens[1]
-            params_start = 2
-            params_end = params_start + cls._OP_NUM_DESTS + cls._OP_NUM_SOURCES
-            dst_src = cls.parsePISASourceDestsFromTokens(instr_tokens,
-                                                         cls._OP_NUM_DESTS,
-                                                         cls._OP_NUM_SOURCES,
-                                                         params_start)
-            retval.update(dst_src)
-            # Ignore "res", but make sure it exists (syntax)
-            assert(instr_tokens[params_end] is not None)
-
-            retval = Namespace(**retval)
-            assert(retval.op_name == cls.OP_NAME_PISA)
+            retval = cls.parseFromPISATokens(*tokens)
         return retval
 
+    @classmethod
+    def _parsePISAParamsFromTokens(cls, instr_tokens: tuple, params_end: int, parsed_op: dict):
+        """
+        Checks the res parameter of an `rshuffle` instruction, which is not stored in `parsed_op`.
+
+        Parameters:
+            instr_tokens (tuple of str): Tokens for the instruction, as returned by `tokenizeFromLine()`.
+            params_end (int): Index in `instr_tokens` of the first token after the destinations and sources.
+            parsed_op (dict): Dictionary of parsed fields to update.
+        """
+        # Ignore "res", but make sure it exists (syntax)
+        if len(instr_tokens) <= params_end:
+            raise ValueError(f'Missing "res" for instruction "{cls.OP_NAME_PISA}".')
+
     @classmethod
     def _get_OP_NAME_ASM(cls) -> str:
         """
@@ -184,9 +180,9 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If `latency` is less than the special latency for rshuffle instructions.
         """
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
         if latency < Instruction._OP_RMOVE_LATENCY:
             raise ValueError((f'`latency`: expected a value greater than or equal to '
@@ -260,11 +256,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the number of destinations is incorrect or if the list does not contain `Variable` objects.
         """
-        if len(value) != Instruction._OP_NUM_DESTS:
-            raise ValueError((f"`value`: Expected list of {Instruction._OP_NUM_DESTS} Variable objects, "
-                              "but list with {len(value)} elements received."))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of Variable objects.")
+        self._validateVarList(value, Instruction._OP_NUM_DESTS)
         super()._set_dests(value)
 
     def _set_sources(self, value):
@@ -277,11 +269,7 @@ class Instruction(XInstruction):
         Raises:
             ValueError: If the number of sources is incorrect or if the list does not contain `Variable` objects.
         """
-        if len(value) != Instruction._OP_NUM_SOURCES:
-            raise ValueError((f"`value`: Expected list of {Instruction._OP_NUM_SOURCES} Variable objects, "
-                              "but list with {len(value)} elements received."))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of Variable objects.")
+        self._validateVarList(value, Instruction._OP_NUM_SOURCES)
         super()._set_sources(value)
 
     def _get_cycle_ready(self):
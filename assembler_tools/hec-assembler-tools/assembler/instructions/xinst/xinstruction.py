@@ -1,4 +1,4 @@
-﻿from argparse import Namespace
+﻿import warnings
 
 from assembler.common import constants
 from assembler.common.cycle_tracking import CycleType
@@ -16,6 +16,12 @@ class XInstruction(BaseInstruction):
     Static Methods:
         tokenizeFromPISALine: Checks if the specified instruction can be parsed from the specified line and returns the tokenized line.
         parsePISASourceDestsFromTokens: Parses the sources and destinations for an instruction from tokens in P-ISA format.
+
+    Class Methods:
+        SetNumSources: Sets the number of sources from the ISA spec, and the number of sources in P-ISA format.
+        parseFromPISATokens: Parses an instruction of this type from an already tokenized Kernel instruction.
+        _parsePISAParamsFromTokens: Parses the parameters that follow the destinations and sources in P-ISA format.
+            Derived classes override it when their parameters differ from a single residual.
         reset_GlobalCycleReady: Resets global cycle tracking for derived classes.
 
     Methods:
@@ -23,6 +29,17 @@ class XInstruction(BaseInstruction):
         res: Returns the residual for the operation.
     """
 
+    __slots__ = ('__n', '__res')
+
+    # To be initialized from ASM ISA spec
+    _OP_NUM_PISA_SOURCES: int
+
+    @classmethod
+    def SetNumSources(cls, val):
+        cls._OP_NUM_SOURCES = val
+        # Derived classes whose P-ISA format omits some sources override this
+        cls._OP_NUM_PISA_SOURCES = val
+
     @staticmethod
     def tokenizeFromPISALine(op_name: str, line: str) -> list:
         """
@@ -47,7 +64,7 @@ class XInstruction(BaseInstruction):
     def parsePISASourceDestsFromTokens(tokens: list,
                                        num_dests: int,
                                        num_sources: int,
-                                       offset: int = 0) -> dict:
+                                       offset: int = 0) -> tuple:
         """
         Parses the sources and destinations for an instruction, given sources and
         destinations in tokens in P-ISA format.
@@ -63,27 +80,66 @@ class XInstruction(BaseInstruction):
             offset (int, optional): Offset in the list of tokens where to start parsing. Defaults to 0.
 
         Returns:
-            dict: A dictionary with, at most, two keys: "src" and "dst", representing the parsed sources
-                  and destinations for the instruction. The value for each key is a list of parsed
-                  `Variable` tuples.
-        """
-        retval = {}
-        dst_start = offset
-        dst_end = dst_start + num_dests
-        dst = []
-        for dst_token in tokens[dst_start:dst_end]:
-            dst.append(Variable.parseFromPISAFormat(dst_token))
-        src_start = dst_end
-        src_end = src_start + num_sources
-        src = []
-        for src_token in tokens[src_start:src_end]:
-            src.append(Variable.parseFromPISAFormat(src_token))
-        if dst:
-            retval["dst"] = dst
-        if src:
-            retval["src"] = src
+            tuple: A tuple `(dst, src)` with the parsed destinations and sources for the instruction.
+                   Each element is a list of parsed `Variable` tuples.
+        """
+        parseFromPISAFormat = Variable.parseFromPISAFormat
+        dst_end = offset + num_dests
+        src_end = dst_end + num_sources
+        dst = [ parseFromPISAFormat(dst_token) for dst_token in tokens[offset:dst_end] ]
+        src = [ parseFromPISAFormat(src_token) for src_token in tokens[dst_end:src_end] ]
+        return dst, src
+
+    @classmethod
+    def parseFromPISATokens(cls, instr_tokens: tuple, comment: str = "") -> dict:
+        """
+        Parses an instruction of this type from an already tokenized Kernel instruction.
+
+        Destinations and sources are parsed according to the number of destinations and P-ISA
+        sources of the instruction. The parameters that follow them are parsed by
+        `_parsePISAParamsFromTokens()`.
+
+        Parameters:
+            instr_tokens (tuple of str): Tokens for the instruction, as returned by `tokenizeFromLine()`.
+                The operation name in `instr_tokens[1]` must match this instruction.
+            comment (str): Comment attached to the line (empty string if no comment).
+
+        Returns:
+            dict: A dictionary with the same keys as returned by `parseFromPISALine()` of the derived class.
+        """
+        retval = {"comment": comment}
+        if len(instr_tokens) > cls._OP_NUM_TOKENS:
+            warnings.warn(f'Extra tokens detected for instruction "{cls.OP_NAME_PISA}"', SyntaxWarning)
+
+        retval["N"] = int(instr_tokens[0])
+        retval["op_name"] = instr_tokens[1]
+        params_start = 2
+        params_end = params_start + cls._OP_NUM_DESTS + cls._OP_NUM_PISA_SOURCES
+        retval["dst"], retval["src"] = cls.parsePISASourceDestsFromTokens(instr_tokens,
+                                                                          cls._OP_NUM_DESTS,
+                                                                          cls._OP_NUM_PISA_SOURCES,
+                                                                          params_start)
+        cls._parsePISAParamsFromTokens(instr_tokens, params_end, retval)
+
+        assert(retval["op_name"] == cls.OP_NAME_PISA)
         return retval
 
+    @classmethod
+    def _parsePISAParamsFromTokens(cls, instr_tokens: tuple, params_end: int, parsed_op: dict):
+        """
+        Parses the parameters that follow the destinations and sources of an instruction
+        in P-ISA format into `parsed_op`.
+
+        By default, a single residual token is expected. Derived classes with other
+        parameters override this method.
+
+        Parameters:
+            instr_tokens (tuple of str): Tokens for the instruction, as returned by `tokenizeFromLine()`.
+            params_end (int): Index in `instr_tokens` of the first token after the destinations and sources.
+            parsed_op (dict): Dictionary of parsed fields to update.
+        """
+        parsed_op["res"] = int(instr_tokens[params_end])
+
     @classmethod
     def reset_GlobalCycleReady(cls, value=CycleType(0, 0)):
         """
@@ -212,13 +268,15 @@ class XInstruction(BaseInstruction):
             str: The instruction in P-ISA kernel format.
         """
         preamble = (self.N,)
-        extra_args = tuple(src.toPISAFormat() for src in self.sources) + extra_args
-        extra_args = tuple(dst.toPISAFormat() for dst in self.dests) + extra_args
+        # dst0, ..., dst_d, src0, ..., src_s [, extra], res
+        args = [ dst.toPISAFormat() for dst in self.dests ]
+        args.extend([ src.toPISAFormat() for src in self.sources ])
+        args.extend(extra_args)
         if self.res is not None:
-            extra_args += (self.res,)
+            args.append(self.res)
         return self.toStringFormat(preamble,
                                    self.OP_NAME_PISA,
-                                   *extra_args)
+                                   *args)
 
     def _toXASMISAFormat(self, *extra_args) -> str:
         """
@@ -234,15 +292,15 @@ class XInstruction(BaseInstruction):
         """
         # preamble = (self.id[0], self.N)
         preamble = (self.id[0],)
-        # Instruction sources
-        extra_args = tuple(src.toXASMISAFormat() for src in self.sources) + extra_args
-        # Instruction destinations
-        extra_args = tuple(dst.toXASMISAFormat() for dst in self.dests) + extra_args
+        # Instruction destinations, then sources
+        args = [ dst.toXASMISAFormat() for dst in self.dests ]
+        args.extend([ src.toXASMISAFormat() for src in self.sources ])
+        args.extend(extra_args)
         if self.res is not None:
-            extra_args += (self.res % constants.MemoryModel.MAX_RESIDUALS,)
+            args.append(self.res % constants.MemoryModel.MAX_RESIDUALS)
         return self.toStringFormat(preamble,
                                    self.OP_NAME_ASM,
-                                   *extra_args)
+                                   *args)
     
     @classmethod
     def _get_OP_NAME_ASM(cls) -> str:
@@ -21,6 +21,8 @@ class Instruction(XInstruction):
         reset_GlobalCycleReady: Resets the global cycle ready for `xstore` instructions.
     """
 
+    __slots__ = ('__mem_model', 'dest_spad_address')
+
     __xstore_global_cycle_ready = CycleType(0, 0) # private class attribute to track cycle ready among xstores
 
     @classmethod
@@ -67,9 +69,9 @@ class Instruction(XInstruction):
         """
         if not isinstance(mem_model, MemoryModel):
             raise ValueError('`mem_model` must be an instance of `MemoryModel`.')
-        if not throughput:
+        if throughput is None:
             throughput = Instruction._OP_DEFAULT_THROUGHPUT
-        if not latency:
+        if latency is None:
             latency = Instruction._OP_DEFAULT_LATENCY
         N = 0 # Does not require ring-size
         super().__init__(id, N, throughput, latency, comment=comment)
@@ -147,12 +149,7 @@ class Instruction(XInstruction):
             ValueError: If the number of destinations is incorrect.
             TypeError: If the list does not contain `Variable` objects.
         """
-        if len(value) != Instruction._OP_NUM_DESTS:
-            raise ValueError(("`value`: Expected list of {} `Variable` objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of `Variable` objects.")
+        self._validateVarList(value, Instruction._OP_NUM_DESTS)
         super()._set_dests(value)
 
     def _set_sources(self, value):
@@ -166,12 +163,7 @@ class Instruction(XInstruction):
             ValueError: If the number of sources is incorrect.
             TypeError: If the list does not contain `Variable` objects.
         """
-        if len(value) != Instruction._OP_NUM_SOURCES:
-            raise ValueError(("`value`: Expected list of {} `Variable` objects, "
-                              "but list with {} elements received.".format(Instruction._OP_NUM_SOURCES,
-                                                                           len(value))))
-        if not all(isinstance(x, Variable) for x in value):
-            raise ValueError("`value`: Expected list of `Variable` objects.")
+        self._validateVarList(value, Instruction._OP_NUM_SOURCES)
         super()._set_sources(value)
         self.__internal_set_dests(value)
 
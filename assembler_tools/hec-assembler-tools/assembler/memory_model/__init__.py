@@ -373,10 +373,11 @@ class MemoryModel:
             ValueError: If the suggested bank does not match the existing variable's suggested bank.
         """
 
-        retval = self.variables[var_name] if var_name in self.variables else None
-        if not retval:
+        variables = self.__variables
+        retval = variables.get(var_name)
+        if retval is None:
             retval = Variable(var_name, suggested_bank)
-            self.variables[retval.name] = retval
+            variables[retval.name] = retval
         if retval.suggested_bank < 0:
             retval.suggested_bank = suggested_bank
         elif suggested_bank >= 0:
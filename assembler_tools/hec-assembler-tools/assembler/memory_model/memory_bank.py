@@ -131,18 +131,20 @@ class MemoryBank:
             ValueError: If the address is out of range or already occupied by a different object.
             RuntimeError: If the memory bank is out of capacity.
         """
-        if self.currentCapacityWords <= 0:
+        if self._current_data_capacity_words <= 0:
             raise RuntimeError("Critical error: Out of memory.")
-        if addr < 0 or addr >= len(self.buffer):
+        buffer = self.__buffer
+        if addr < 0 or addr >= len(buffer):
             raise ValueError(("`addr` out of range. Must be in range [0, {}),"
-                              "but {} received.".format(len(self.buffer), addr)))
-        if not self.buffer[addr]:
+                              "but {} received.".format(len(buffer), addr)))
+        contained_obj = buffer[addr]
+        if not contained_obj:
             # track the obj our buffer
-            self.buffer[addr] = obj
+            buffer[addr] = obj
             # update capacity
             self._current_data_capacity_words -= 1
         else:
-            if self.buffer[addr] != obj:
+            if contained_obj != obj:
                 raise ValueError("`addr` {} already occupied.".format(addr))
 
     def deallocate(self, addr) -> object:
@@ -158,15 +160,16 @@ class MemoryBank:
         Returns:
             object: The object that was contained in the deallocated slot.
         """
-        if addr < 0 or addr >= len(self.buffer):
+        buffer = self.__buffer
+        if addr < 0 or addr >= len(buffer):
             raise ValueError(("`addr` out of range. Must be in range [0, {}),"
-                              "but {} received.".format(len(self.buffer), addr)))
+                              "but {} received.".format(len(buffer), addr)))
 
-        obj = self.buffer[addr]
+        obj = buffer[addr]
         if not obj:
             raise ValueError('`addr`: Adress "{}" is already free.'.format(addr))
 
-        self.buffer[addr] = None
+        buffer[addr] = None
         self._current_data_capacity_words += 1
 
         return obj
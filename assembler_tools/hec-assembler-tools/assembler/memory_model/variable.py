@@ -68,15 +68,16 @@ class Variable(CycleTracker):
         Returns:
             tuple: A tuple representing the parsed information that can be used to construct a `Variable` object.
         """
-        tokens = list(map(lambda s: s.strip(), s_pisa.split()))
-        if len(tokens) > 2 or len(tokens) < 1:
-            raise ValueError(f'Invalid format for P-ISA variable: {s_pisa}.')
-        if len(tokens) < 2:
+        tokens = s_pisa.split() # split() with no arguments already drops surrounding whitespace
+        num_tokens = len(tokens)
+        if num_tokens == 2:
+            retval = (tokens[0], int(tokens[1].strip("()")))
+        elif num_tokens == 1:
             # default to suggested bank -1
-            tokens.append(-1)
+            retval = (tokens[0], -1)
         else:
-            tokens[1] = int(tokens[1].strip("()"))
-        return tuple(tokens)
+            raise ValueError(f'Invalid format for P-ISA variable: {s_pisa}.')
+        return retval
 
     @classmethod
     def validateName(cls, name: str) -> bool:
@@ -2,6 +2,7 @@
 
 from assembler.common.constants import Constants
 from assembler.instructions import xinst
+from assembler.instructions import tokenizeFromLine
 from assembler.instructions.xinst.xinstruction import XInstruction
 from assembler.instructions.xinst import parse_xntt
 from assembler.memory_model import MemoryModel
@@ -250,8 +251,8 @@ def preprocessPISAKernelListing(mem_model: MemoryModel,
               Variables in `mem_model` collection of variables will be modified to reflect
               assigned bank in `suggested_bank` attribute.
     """
-    NTT_KERNEL_GRAMMAR = lambda line: parse_xntt.parseXNTTKernelLine(line, xinst.NTT.OP_NAME_PISA, Constants.TW_GRAMMAR_SEPARATOR)
-    iNTT_KERNEL_GRAMMAR = lambda line: parse_xntt.parseXNTTKernelLine(line, xinst.iNTT.OP_NAME_PISA, Constants.TW_GRAMMAR_SEPARATOR)
+    NTT_KERNEL_GRAMMAR = lambda line, tokens: parse_xntt.parseXNTTKernelLine(line, xinst.NTT.OP_NAME_PISA, Constants.TW_GRAMMAR_SEPARATOR, tokens)
+    iNTT_KERNEL_GRAMMAR = lambda line, tokens: parse_xntt.parseXNTTKernelLine(line, xinst.iNTT.OP_NAME_PISA, Constants.TW_GRAMMAR_SEPARATOR, tokens)
 
     retval = []
 
@@ -263,11 +264,13 @@ def preprocessPISAKernelListing(mem_model: MemoryModel,
         if progress_verbose and line_no % 100 == 0:
             print(f"{num_input_insts}")
 
+        # Tokenize once: every grammar below is tested against the same tokens
+        tokens = tokenizeFromLine(s_line)
         parsed_insts = None
         if not parsed_insts:
-            parsed_op = NTT_KERNEL_GRAMMAR(s_line)
+            parsed_op = NTT_KERNEL_GRAMMAR(s_line, tokens)
             if not parsed_op:
-                parsed_op = iNTT_KERNEL_GRAMMAR(s_line)
+                parsed_op = iNTT_KERNEL_GRAMMAR(s_line, tokens)
             if parsed_op:
                 # Instruction is a P-ISA xntt
                 parsed_insts = parse_xntt.generateXNTT(mem_model,
@@ -275,7 +278,7 @@ def preprocessPISAKernelListing(mem_model: MemoryModel,
                                                        new_id = line_no)
         if not parsed_insts:
             # Instruction is one that is represented by single XInst
-            inst = xinst.createFromPISALine(mem_model, s_line, line_no)
+            inst = xinst.createFromPISALine(mem_model, s_line, line_no, tokens)
             if inst:
                 parsed_insts = [ inst ]
 
@@ -250,27 +250,25 @@ def asmisaAssemble(run_config,
     if b_verbose:
         print("Saving minst...")
     with open(output_minst_filename, 'w') as outnum:
-        for idx, inst in enumerate(minsts):
-            inst_line = inst.toMASMISAFormat()
-            if inst_line:
-                print(f"{idx}, {inst_line}", file=outnum)
+        # Stream the whole listing through a single `writelines()` call
+        outnum.writelines(f"{idx}, {inst_line}\n"
+                          for idx, inst_line in enumerate(inst.toMASMISAFormat() for inst in minsts)
+                          if inst_line)
 
     if b_verbose:
         print("Saving cinst...")
     with open(output_cinst_filename, 'w') as outnum:
-        for idx, inst in enumerate(cinsts):
-            inst_line = inst.toCASMISAFormat()
-            if inst_line:
-                print(f"{idx}, {inst_line}", file=outnum)
+        outnum.writelines(f"{idx}, {inst_line}\n"
+                          for idx, inst_line in enumerate(inst.toCASMISAFormat() for inst in cinsts)
+                          if inst_line)
 
     if b_verbose:
         print("Saving xinst...")
     with open(output_xinst_filename, 'w') as outnum:
-        for bundle_i, bundle_data in enumerate(xinsts):
-            for inst in bundle_data[0]:
-                inst_line = inst.toXASMISAFormat()
-                if inst_line:
-                    print(f"F{bundle_i}, {inst_line}", file=outnum)
+        outnum.writelines(f"F{bundle_i}, {inst_line}\n"
+                          for bundle_i, bundle_data in enumerate(xinsts)
+                          for inst_line in (inst.toXASMISAFormat() for inst in bundle_data[0])
+                          if inst_line)
 
     return num_xinsts, num_nops, num_idle_cycles, deps_end, sched_end
 
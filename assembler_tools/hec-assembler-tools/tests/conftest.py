@@ -0,0 +1,36 @@
+# Copyright (C) 2024 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""Shared fixtures for the assembler tools tests"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# The assembler and linker packages are imported from the tool directory,
+# the same way the he_* scripts import them
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+
+@pytest.fixture(name="tools_dir")
+def fixture_tools_dir() -> Path:
+    """Directory containing the he_prep, he_as and he_link scripts"""
+    return TOOLS_DIR
+
+
+@pytest.fixture(name="data_dir")
+def fixture_data_dir() -> Path:
+    """Directory containing the sample kernels and their expected outputs"""
+    return Path(__file__).resolve().parent / "data"
+
+
+@pytest.fixture(name="isa_spec", scope="session")
+def fixture_isa_spec() -> str:
+    """Initializes the instruction classes from the default ISA spec and
+    returns the path of the spec file"""
+    from assembler.isa_spec import SpecConfig
+
+    return SpecConfig.initialize_isa_spec(str(TOOLS_DIR), "")
@@ -0,0 +1,69 @@
+# Copyright (C) 2024 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""Regression test of the he_prep, he_as and he_link pipeline against golden outputs"""
+
+import shutil
+import sys
+from pathlib import Path
+from subprocess import run
+
+import pytest
+
+# Outputs checked for each kernel: the preprocessed kernel (he_prep), the
+# assembled listings (he_as) and the linked program (he_link)
+OUTPUT_EXTENSIONS = [
+    "tw.csv",
+    "tw.xinst",
+    "tw.cinst",
+    "tw.minst",
+    "xinst",
+    "cinst",
+    "minst",
+]
+
+
+def execute_process(cmd: list, cwd: Path):
+    """Helper function for executing processes. stdout and stderr are always
+    captured. NOTE: subprocess.run will fail silently with a non-zero exit code
+    so always check the returncode"""
+    return run(
+        [sys.executable] + list(map(str, cmd)),
+        cwd=cwd,
+        capture_output=True,
+        check=False,
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.parametrize("kernel", ["MUL_C16K1rns", "XINST_OPS"])
+def test_pipeline_matches_golden(tools_dir, data_dir, tmp_path, kernel):
+    """Test that preprocessing, assembling and linking a sample kernel reproduces
+    the golden outputs byte for byte"""
+    shutil.copy(data_dir / f"{kernel}.csv", tmp_path)
+    shutil.copy(data_dir / f"{kernel}.mem", tmp_path)
+    kernel_path = tmp_path / kernel
+    mem_file = tmp_path / f"{kernel}.mem"
+
+    steps = [
+        [tools_dir / "he_prep.py", f"{kernel_path}.csv"],
+        [tools_dir / "he_as.py", f"{kernel_path}.tw.csv", "--input_mem_file", mem_file],
+        [
+            tools_dir / "he_link.py",
+            f"{kernel_path}.tw",
+            "--input_mem_file",
+            mem_file,
+            "--output_prefix",
+            kernel,
+            "-od",
+            tmp_path,
+        ],
+    ]
+    for cmd in steps:
+        result = execute_process(cmd, cwd=tmp_path)
+        assert result.returncode == 0, result.stderr
+
+    for ext in OUTPUT_EXTENSIONS:
+        expected = (data_dir / f"{kernel}.{ext}").read_text(encoding="utf-8")
+        actual = (tmp_path / f"{kernel}.{ext}").read_text(encoding="utf-8")
+        assert actual == expected, f"{kernel}.{ext} differs from golden output"
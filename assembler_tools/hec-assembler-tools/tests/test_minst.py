@@ -0,0 +1,18 @@
+# Copyright (C) 2024 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""Test the common behaviour of MInstructions"""
+
+from assembler.common.counter import Counter
+from assembler.instructions.minst.minstruction import MInstruction
+
+
+def test_minst_count(isa_spec):
+    """Test MInstructions are numbered in creation order and that numbering
+    restarts when the counters are reset"""
+    Counter.reset()
+    counts = [MInstruction(0, 1, 1).count for _ in range(3)]
+    assert counts == [0, 1, 2]
+
+    Counter.reset()
+    assert MInstruction(0, 1, 1).count == 0
@@ -0,0 +1,98 @@
+# Copyright (C) 2024 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""Test parsing of XInstructions from P-ISA kernel lines"""
+
+import pytest
+
+from assembler.instructions.xinst import add, irshuffle, mac, maci, ntt, rshuffle, twntt
+
+SHUFFLES = [rshuffle.Instruction, irshuffle.Instruction]
+
+
+@pytest.mark.parametrize(
+    "inst_type,line,expected",
+    [
+        (
+            add.Instruction,
+            "13, add, output_0_1_3 (2), c_0_1_3 (0), d_0_1_3 (1), 1 # sum",
+            {
+                "dst": [("output_0_1_3", 2)],
+                "src": [("c_0_1_3", 0), ("d_0_1_3", 1)],
+                "res": 1,
+                "comment": " sum",
+            },
+        ),
+        (
+            mac.Instruction,
+            "13, mac, c2_rlk_0_10_0 (3), coeff_0_0_0 (2), rlk_0_2_10_0 (0), 10",
+            {
+                "dst": [("c2_rlk_0_10_0", 3)],
+                "src": [("coeff_0_0_0", 2), ("rlk_0_2_10_0", 0)],
+                "res": 10,
+            },
+        ),
+        (
+            maci.Instruction,
+            "13, maci, coeff_0_1_3 (2), c2_4_3 (3), Qqr_extend_2_13_4, 13",
+            {
+                "dst": [("coeff_0_1_3", 2)],
+                "src": [("c2_4_3", 3)],
+                "imm": "Qqr_extend_2_13_4",
+                "res": 13,
+            },
+        ),
+        (
+            ntt.Instruction,
+            "13, ntt, outtmp_9_0 (2), outtmp_9_2 (3), output_9_0 (2), output_9_1 (3), w_gen_17_1 (1), 1, 9",
+            {
+                "dst": [("outtmp_9_0", 2), ("outtmp_9_2", 3)],
+                "src": [("output_9_0", 2), ("output_9_1", 3), ("w_gen_17_1", 1)],
+                "stage": 1,
+                "res": 9,
+            },
+        ),
+        (
+            twntt.Instruction,
+            "13, twntt, w_gen_17_1 (1), w_gen_17_1 (1), 9, 300, 1, 0",
+            {
+                "dst": [("w_gen_17_1", 1)],
+                "src": [("w_gen_17_1", 1)],
+                "tw_meta": 9,
+                "stage": 300,
+                "block": 1,
+                "res": 0,
+            },
+        ),
+    ],
+    ids=["add", "mac", "maci", "ntt", "twntt"],
+)
+def test_parse_from_pisa_line(isa_spec, inst_type, line, expected):
+    """Test P-ISA lines parse into dictionaries of the instruction fields"""
+    expected = {"comment": "", "N": 13, "op_name": inst_type.OP_NAME_PISA, **expected}
+    assert inst_type.parseFromPISALine(line) == expected
+
+
+@pytest.mark.parametrize("inst_type", SHUFFLES, ids=["rshuffle", "irshuffle"])
+def test_shuffle_parse(isa_spec, inst_type):
+    """Test shuffles parse destinations and sources and ignore the residual"""
+    op_name = inst_type.OP_NAME_PISA
+    parsed_op = inst_type.parseFromPISALine(
+        f"13, {op_name}, a (2), b (3), c (2), d (3), 0 # shuffle"
+    )
+    assert parsed_op == {
+        "comment": " shuffle",
+        "N": 13,
+        "op_name": op_name,
+        "dst": [("a", 2), ("b", 3)],
+        "src": [("c", 2), ("d", 3)],
+    }
+
+
+@pytest.mark.parametrize("inst_type", SHUFFLES, ids=["rshuffle", "irshuffle"])
+def test_shuffle_missing_res(isa_spec, inst_type):
+    """Test shuffles raise an error when the residual is missing"""
+    op_name = inst_type.OP_NAME_PISA
+    with pytest.raises(ValueError) as e:
+        inst_type.parseFromPISALine(f"13, {op_name}, a (2), b (3), c (2), d (3)")
+    assert str(e.value) == f'Missing "res" for instruction "{op_name}".'